@@ -0,0 +1,72 @@
+from array import array
+from collections.abc import Mapping, Sequence
+
+from model_objects import ProductQuantity
+from shopping_cart import ShoppingCart
+
+
+class ScannedItems(Sequence):
+    def __init__(self, products, product_ids, quantities):
+        self._products = products
+        self._product_ids = product_ids
+        self._quantities = quantities
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return ProductQuantity(self._products[self._product_ids[index]], self._quantities[index])
+
+    def __len__(self):
+        return len(self._quantities)
+
+    def __iter__(self):
+        products = self._products
+        for product_id, quantity in zip(self._product_ids, self._quantities):
+            yield ProductQuantity(products[product_id], quantity)
+
+
+class ProductTotals(Mapping):
+    def __init__(self, products, product_index, totals):
+        self._products = products
+        self._product_index = product_index
+        self._totals = totals
+
+    def __getitem__(self, product):
+        return self._totals[self._product_index[product]]
+
+    def __contains__(self, product):
+        return product in self._product_index
+
+    def __len__(self):
+        return len(self._products)
+
+    def __iter__(self):
+        return iter(self._products)
+
+
+class ArrayShoppingCart(ShoppingCart):
+    # Quantities are stored as C doubles, so integer quantities come back
+    # as floats, the same as ShoppingCart.add_item already does.
+
+    def __init__(self):
+        self._products = []
+        self._product_index = {}
+        self._product_ids = array('l')
+        self._quantities = array('d')
+        self._totals = array('d')
+        self._items = ScannedItems(self._products, self._product_ids, self._quantities)
+        self._product_quantities = ProductTotals(self._products, self._product_index, self._totals)
+        self._observers = []
+
+    def add_item_quantity(self, product, quantity):
+        product_id = self._product_index.get(product)
+        if product_id is None:
+            product_id = self._product_index[product] = len(self._products)
+            self._products.append(product)
+            self._totals.append(quantity)
+        else:
+            self._totals[product_id] += quantity
+        self._product_ids.append(product_id)
+        self._quantities.append(quantity)
+        for observer in self._observers:
+            observer.item_added(product, quantity)
@@ -0,0 +1,102 @@
+import asyncio
+
+from teller import Teller
+
+
+class PriceLoader:
+    # Lookups requested during one event-loop tick are sent to the catalog
+    # as a single unit_prices call; a product already on its way is not
+    # requested again by later checkouts. Each waiter gets a shielded view
+    # of the shared future, so cancelling one checkout leaves the others.
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.batches = 0
+        self._pending = {}
+        self._in_flight = {}
+        self._tasks = set()
+
+    def load(self, product):
+        future = self._pending.get(product)
+        if future is None:
+            future = self._in_flight.get(product)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = self._pending[product] = loop.create_future()
+        return asyncio.shield(future)
+
+    async def load_many(self, products):
+        products = list(dict.fromkeys(products))
+        prices = await asyncio.gather(*(self.load(product) for product in products))
+        return dict(zip(products, prices))
+
+    def _dispatch(self):
+        batch, self._pending = self._pending, {}
+        self._in_flight.update(batch)
+        self.batches += 1
+        task = asyncio.ensure_future(self._fetch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, batch):
+        try:
+            prices = await self.catalog.unit_prices(list(batch))
+        except Exception as error:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            for product, future in batch.items():
+                if future.done():
+                    continue
+                if product in prices:
+                    future.set_result(prices[product])
+                else:
+                    future.set_exception(KeyError(product.name))
+        finally:
+            for product in batch:
+                del self._in_flight[product]
+
+
+class AsyncTeller:
+    # Checks carts out against an async catalog. It wraps a Teller for the
+    # snapshot and the pricing instead of extending it, so Teller's
+    # synchronous checkouts, which would call the catalog without awaiting
+    # it, are not part of this class.
+
+    def __init__(self, catalog, stats=None):
+        self._teller = Teller(catalog, stats)
+        self.price_loader = PriceLoader(catalog)
+
+    @property
+    def catalog(self):
+        return self._teller.catalog
+
+    @property
+    def snapshot(self):
+        return self._teller.snapshot
+
+    @property
+    def offers(self):
+        return self._teller.offers
+
+    def add_special_offer(self, offer_type, product, argument):
+        self._teller.add_special_offer(offer_type, product, argument)
+
+    def update_prices(self, prices):
+        self._teller.update_prices(prices)
+
+    async def load_prices(self, products):
+        self.update_prices(await self.price_loader.load_many(products))
+
+    async def checks_out_articles_from(self, the_cart):
+        snapshot = self.snapshot
+        unit_prices, missing = snapshot.known_prices(the_cart.product_quantities)
+        if missing:
+            unit_prices.update(await self.price_loader.load_many(missing))
+        return self._teller.price_cart(the_cart, unit_prices, snapshot)
+
+    async def checks_out_many(self, carts):
+        return await asyncio.gather(*(self.checks_out_articles_from(cart) for cart in carts))
@@ -0,0 +1,67 @@
+"""
+Teller.checks_out_many against checking the same carts out one at a time.
+
+Run from the python folder with:
+
+python -m benchmarks.batch_benchmark --carts 20000 --lines 20
+"""
+
+import argparse
+import gc
+import statistics
+import sys
+import time
+
+from benchmarks.data_generator import SyntheticData
+
+
+def timed(operation, repeats):
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        result = operation()
+        timings.append(time.perf_counter() - start)
+        del result
+    return statistics.median(timings)
+
+
+def run(carts=20_000, lines=20, catalog_size=1000, offers_density=0.2, repeats=3):
+    data = SyntheticData(catalog_size, offers_density)
+    cart_list = [data.cart(lines) for _ in range(carts)]
+    teller = data.teller
+
+    per_cart = timed(lambda: [teller.checks_out_articles_from(cart) for cart in cart_list], repeats)
+    batch = timed(lambda: teller.checks_out_many(cart_list), repeats)
+    # Batch receipts build their items when first read; time that as well.
+    batch_items = timed(lambda: [receipt.items for receipt in teller.checks_out_many(cart_list)], repeats)
+    return {
+        "carts": carts,
+        "lines": lines,
+        "per_cart_seconds": per_cart,
+        "batch_seconds": batch,
+        "batch_items_seconds": batch_items,
+        "speedup": per_cart / batch,
+        "items_speedup": per_cart / batch_items,
+    }
+
+
+def main(args):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--carts", type=int, default=20_000)
+    parser.add_argument("--lines", type=int, default=20)
+    parser.add_argument("--catalog-size", type=int, default=1000)
+    parser.add_argument("--offers-density", type=float, default=0.2)
+    parser.add_argument("--repeats", type=int, default=3)
+    options = parser.parse_args(args)
+
+    result = run(options.carts, options.lines, options.catalog_size, options.offers_density, options.repeats)
+    print(f"one at a time   {result['per_cart_seconds']:.3f} s")
+    print(f"checks_out_many {result['batch_seconds']:.3f} s")
+    print(f"  items read    {result['batch_items_seconds']:.3f} s")
+    print(f"speedup         {result['speedup']:.2f}x ({result['items_speedup']:.2f}x with items read)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
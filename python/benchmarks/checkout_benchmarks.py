@@ -0,0 +1,132 @@
+"""
+Throughput, latency and peak memory of the checkout hot paths.
+
+Run from the python folder with:
+
+python -m benchmarks.checkout_benchmarks --output results.json
+python -m benchmarks.checkout_benchmarks --baseline results.json --tolerance 0.2
+
+With --baseline the run exits with status 1 when any benchmark's throughput
+drops by more than the tolerance compared to the stored results.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+from benchmarks.data_generator import SyntheticData
+from receipt_printer import ReceiptPrinter
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+
+def check_out(data, cart):
+    return lambda: data.teller.checks_out_articles_from(cart)
+
+
+def handle_offers(data, cart):
+    receipt = data.teller.checks_out_articles_from(cart)
+    return lambda: cart.handle_offers(receipt, data.teller.offers, data.catalog)
+
+
+def total_price(data, cart):
+    receipt = data.teller.checks_out_articles_from(cart)
+    return receipt.total_price
+
+
+def print_receipt(data, cart):
+    receipt = data.teller.checks_out_articles_from(cart)
+    printer = ReceiptPrinter()
+    return lambda: printer.print_receipt(receipt)
+
+
+BENCHMARKS = {
+    "checks_out_articles_from": check_out,
+    "handle_offers": handle_offers,
+    "total_price": total_price,
+    "print_receipt": print_receipt,
+}
+
+
+def measure(operation, lines, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(timings)
+    return {
+        "lines": lines,
+        "repeats": repeats,
+        "median_seconds": median,
+        "p95_seconds": sorted(timings)[max(0, round(0.95 * len(timings)) - 1)],
+        "lines_per_second": lines / median if median else float("inf"),
+        "peak_memory_bytes": peak,
+    }
+
+
+def run(sizes, catalog_size, offers_density, kilo_share, names=None):
+    data = SyntheticData(catalog_size, offers_density, kilo_share)
+    results = {}
+    for lines in sizes:
+        cart = data.cart(lines)
+        repeats = max(3, min(50, 100_000 // lines))
+        for name, benchmark in BENCHMARKS.items():
+            if names and name not in names:
+                continue
+            results[f"{name}[{lines}]"] = measure(benchmark(data, cart), lines, repeats)
+    return results
+
+
+def regressions(results, baseline, tolerance):
+    slower = {}
+    for key, result in results.items():
+        expected = baseline.get(key)
+        if expected and result["lines_per_second"] < expected["lines_per_second"] * (1 - tolerance):
+            slower[key] = result["lines_per_second"] / expected["lines_per_second"]
+    return slower
+
+
+def main(args):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--catalog-size", type=int, default=10_000)
+    parser.add_argument("--offers-density", type=float, default=0.2)
+    parser.add_argument("--kilo-share", type=float, default=0.3)
+    parser.add_argument("--benchmark", action="append", choices=sorted(BENCHMARKS))
+    parser.add_argument("--output")
+    parser.add_argument("--baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    options = parser.parse_args(args)
+
+    results = run(options.sizes, options.catalog_size, options.offers_density, options.kilo_share,
+                  options.benchmark)
+    for key, result in results.items():
+        print(f"{key:<40}{result['lines_per_second']:>16,.0f} lines/s"
+              f"{result['median_seconds'] * 1000:>12.3f} ms"
+              f"{result['peak_memory_bytes'] / 1024:>12,.0f} KiB")
+
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if options.baseline:
+        with open(options.baseline) as f:
+            slower = regressions(results, json.load(f), options.tolerance)
+        for key, ratio in slower.items():
+            print(f"REGRESSION {key}: {ratio:.0%} of baseline throughput")
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,141 @@
+"""
+Checkout throughput of one shared Teller as the number of request threads
+grows, while another thread keeps publishing offer and price updates.
+
+Run from the python folder with:
+
+python -m benchmarks.concurrency_benchmark --threads 1 2 4 8 --output results.json
+
+Throughput only scales with threads on a free-threaded (no-GIL) build; the
+report says whether the GIL was enabled. Every run also re-prices a sample
+of receipts against the snapshot version they recorded and reports any that
+do not match.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+
+from benchmarks.data_generator import SyntheticData
+from model_objects import SpecialOfferType
+from teller import Teller
+
+DEFAULT_THREADS = [1, 2, 4, 8]
+
+
+def gil_enabled():
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def publish_updates(data, snapshots, stop, interval):
+    # Alternates offer and price updates, remembering every snapshot so
+    # receipts can be checked against the version that priced them.
+    teller = data.teller
+    random = data.random
+    while not stop.wait(interval):
+        product = random.choice(data.products)
+        if random.random() < 0.5:
+            teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, product,
+                                     float(random.choice([5, 10, 20])))
+        else:
+            teller.update_prices({product: round(random.uniform(0.2, 20.0), 2)})
+        snapshots[teller.snapshot.version] = teller.snapshot
+
+
+def check_out_concurrently(teller, carts, threads, checkouts_per_thread):
+    receipts = [None] * threads
+    start_line = threading.Barrier(threads + 1)
+
+    def worker(index):
+        done = []
+        start_line.wait()
+        for i in range(checkouts_per_thread):
+            cart = carts[(index + i) % len(carts)]
+            done.append((cart, teller.checks_out_articles_from(cart)))
+        receipts[index] = done
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    start_line.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - start, [r for done in receipts for r in done]
+
+
+def inconsistent_receipts(data, snapshots, checked_out, sample):
+    reference = Teller(data.catalog)
+    mismatches = 0
+    for cart, receipt in checked_out[::max(1, len(checked_out) // sample)]:
+        reference.snapshot = snapshots[receipt.pricing_version]
+        if reference.checks_out_articles_from(cart).total_price() != receipt.total_price():
+            mismatches += 1
+    return mismatches
+
+
+def run(thread_counts, checkouts_per_thread=2000, lines=20, carts=64, catalog_size=1000,
+        offers_density=0.2, update_interval=0.001, sample=200):
+    data = SyntheticData(catalog_size, offers_density)
+    # Pinned prices make each receipt depend on its snapshot alone.
+    data.teller.load_prices(data.products)
+    cart_pool = [data.cart(lines) for _ in range(carts)]
+
+    results = {}
+    single_thread = None
+    for threads in thread_counts:
+        snapshots = {data.teller.snapshot.version: data.teller.snapshot}
+        stop = threading.Event()
+        writer = threading.Thread(target=publish_updates, args=(data, snapshots, stop, update_interval))
+        writer.start()
+        try:
+            seconds, checked_out = check_out_concurrently(data.teller, cart_pool, threads, checkouts_per_thread)
+        finally:
+            stop.set()
+            writer.join()
+
+        throughput = len(checked_out) / seconds
+        if single_thread is None:
+            single_thread = throughput
+        results[f"threads[{threads}]"] = {
+            "threads": threads,
+            "checkouts": len(checked_out),
+            "seconds": seconds,
+            "checkouts_per_second": throughput,
+            "speedup": throughput / single_thread,
+            "snapshot_versions": len({receipt.pricing_version for _, receipt in checked_out}),
+            "inconsistent_receipts": inconsistent_receipts(data, snapshots, checked_out, sample),
+        }
+    return results
+
+
+def main(args):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, nargs="+", default=DEFAULT_THREADS)
+    parser.add_argument("--checkouts", type=int, default=2000, help="checkouts per thread")
+    parser.add_argument("--lines", type=int, default=20)
+    parser.add_argument("--catalog-size", type=int, default=1000)
+    parser.add_argument("--update-interval", type=float, default=0.001)
+    parser.add_argument("--output")
+    options = parser.parse_args(args)
+
+    results = run(options.threads, options.checkouts, options.lines, catalog_size=options.catalog_size,
+                  update_interval=options.update_interval)
+    print(f"GIL enabled: {gil_enabled()}")
+    for key, result in results.items():
+        print(f"{key:<14}{result['checkouts_per_second']:>14,.0f} checkouts/s"
+              f"{result['speedup']:>8.2f}x"
+              f"{result['snapshot_versions']:>8} versions"
+              f"{result['inconsistent_receipts']:>6} inconsistent")
+
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump({"gil_enabled": gil_enabled(), "results": results}, f, indent=2)
+    return 1 if any(result["inconsistent_receipts"] for result in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
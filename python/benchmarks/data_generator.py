@@ -0,0 +1,43 @@
+import random
+
+from model_objects import Product, ProductUnit, SpecialOfferType
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class SyntheticData:
+
+    def __init__(self, catalog_size=1000, offers_density=0.2, kilo_share=0.3, seed=42):
+        self.random = random.Random(seed)
+        self.catalog = FakeCatalog()
+        self.products = []
+        for i in range(catalog_size):
+            unit = ProductUnit.KILO if self.random.random() < kilo_share else ProductUnit.EACH
+            product = Product(f"product-{i}", unit)
+            self.catalog.add_product(product, round(self.random.uniform(0.2, 20.0), 2))
+            self.products.append(product)
+
+        self.teller = Teller(self.catalog)
+        offer_types = list(SpecialOfferType)
+        for product in self.random.sample(self.products, int(catalog_size * offers_density)):
+            offer_type = self.random.choice(offer_types)
+            self.teller.add_special_offer(offer_type, product, self._argument(offer_type, product))
+
+    def _argument(self, offer_type, product):
+        if offer_type == SpecialOfferType.TEN_PERCENT_DISCOUNT:
+            return float(self.random.choice([5, 10, 20, 50]))
+        if offer_type == SpecialOfferType.THREE_FOR_TWO:
+            return None
+        count = 2 if offer_type == SpecialOfferType.TWO_FOR_AMOUNT else 5
+        return round(self.catalog.unit_price(product) * count * 0.8, 2)
+
+    def cart(self, lines, cart_class=ShoppingCart):
+        cart = cart_class()
+        for _ in range(lines):
+            product = self.random.choice(self.products)
+            if product.unit == ProductUnit.KILO:
+                cart.add_item_quantity(product, round(self.random.uniform(0.1, 3.0), 3))
+            else:
+                cart.add_item_quantity(product, float(self.random.randint(1, 6)))
+        return cart
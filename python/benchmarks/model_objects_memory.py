@@ -0,0 +1,54 @@
+"""
+Compare per-instance memory of the slotted model objects against
+equivalent classes that keep a per-instance __dict__.
+
+Run from the python folder with:
+
+python -m benchmarks.model_objects_memory
+"""
+
+import sys
+import tracemalloc
+
+from model_objects import Product, ProductQuantity, ProductUnit, Offer, Discount, SpecialOfferType
+from receipt import ReceiptItem
+
+
+def with_instance_dict(cls):
+    def __init__(self, *args):
+        for name, value in zip(cls.__slots__, args):
+            setattr(self, name, value)
+    return type(cls.__name__ + "WithDict", (), {"__init__": __init__})
+
+
+def bytes_per_instance(factory, count):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [factory() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    list_overhead = sys.getsizeof(instances)
+    return (allocated - list_overhead) / count
+
+
+def main(args):
+    count = int(args[0]) if args else 100_000
+    product = Product("toothbrush", ProductUnit.EACH)
+    constructor_args = {
+        Product: ("toothbrush", ProductUnit.EACH),
+        ProductQuantity: (product, 1.0),
+        Offer: (SpecialOfferType.TEN_PERCENT_DISCOUNT, product, 10.0),
+        Discount: (product, "10.0% off", -0.099),
+        ReceiptItem: (product, 1.0, 0.99, 0.99),
+    }
+    print(f"{'class':<16}{'dict':>10}{'slots':>10}{'saved':>10}")
+    for cls, cls_args in constructor_args.items():
+        dict_cls = with_instance_dict(cls)
+        with_dict = bytes_per_instance(lambda: dict_cls(*cls_args), count)
+        slotted = bytes_per_instance(lambda: cls(*cls_args), count)
+        print(f"{cls.__name__:<16}{with_dict:>10.1f}{slotted:>10.1f}{1 - slotted / with_dict:>10.0%}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,72 @@
+"""
+CheckoutPool.checks_out_many against checking the same carts out one at a
+time in this process.
+
+Run from the python folder with:
+
+python -m benchmarks.pool_benchmark --carts 20000 --lines 20 --processes 4
+
+Besides wall-clock time it reports the CPU time the parent process spends
+per batch. The pool cannot go faster than that, however many workers it
+has, so serial time divided by parent time is the best speedup possible.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from benchmarks.data_generator import SyntheticData
+from checkout_pool import CheckoutPool
+
+
+def run(carts=20_000, lines=20, catalog_size=1000, offers_density=0.2, processes=None):
+    data = SyntheticData(catalog_size, offers_density)
+    cart_list = [data.cart(lines) for _ in range(carts)]
+    teller = data.teller
+
+    start = time.perf_counter()
+    serial = [teller.checks_out_articles_from(cart) for cart in cart_list]
+    serial_seconds = time.perf_counter() - start
+
+    with CheckoutPool(teller, data.products, processes) as pool:
+        pool.checks_out_many(cart_list[:pool.chunk_size])
+        cpu = time.process_time()
+        start = time.perf_counter()
+        pooled = pool.checks_out_many(cart_list)
+        pool_seconds = time.perf_counter() - start
+        parent_seconds = time.process_time() - cpu
+
+    mismatches = sum(1 for a, b in zip(serial, pooled) if a.total_price() != b.total_price())
+    return {
+        "carts": carts,
+        "lines": lines,
+        "processes": processes or os.cpu_count(),
+        "serial_seconds": serial_seconds,
+        "pool_seconds": pool_seconds,
+        "parent_cpu_seconds": parent_seconds,
+        "speedup": serial_seconds / pool_seconds,
+        "max_speedup": serial_seconds / parent_seconds if parent_seconds else float("inf"),
+        "mismatches": mismatches,
+    }
+
+
+def main(args):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--carts", type=int, default=20_000)
+    parser.add_argument("--lines", type=int, default=20)
+    parser.add_argument("--catalog-size", type=int, default=1000)
+    parser.add_argument("--offers-density", type=float, default=0.2)
+    parser.add_argument("--processes", type=int)
+    options = parser.parse_args(args)
+
+    result = run(options.carts, options.lines, options.catalog_size, options.offers_density, options.processes)
+    print(f"one at a time   {result['serial_seconds']:.3f} s")
+    print(f"pool            {result['pool_seconds']:.3f} s with {result['processes']} processes")
+    print(f"parent cpu      {result['parent_cpu_seconds']:.3f} s")
+    print(f"speedup         {result['speedup']:.2f}x (at most {result['max_speedup']:.2f}x)")
+    return 1 if result["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
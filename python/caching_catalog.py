@@ -0,0 +1,102 @@
+import threading
+import time
+from collections import OrderedDict
+
+from catalog import SupermarketCatalog
+
+
+class CachingCatalog(SupermarketCatalog):
+
+    def __init__(self, catalog, max_size=2000, ttl=None, clock=time.monotonic):
+        self.catalog = catalog
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Bumped by invalidate and invalidate_all. A fetch made outside the
+        # lock only stores its price if neither changed while it ran, so
+        # it cannot put back a price that was invalidated meanwhile.
+        self._generations = {}
+        self._epoch = 0
+        # Guards the LRU order and counters only; the wrapped catalog is
+        # called outside the lock.
+        self._lock = threading.Lock()
+
+    def add_product(self, product, price):
+        self.catalog.add_product(product, price)
+        self.invalidate(product)
+
+    def unit_price(self, product):
+        with self._lock:
+            price = self._cached_price(product)
+            if price is None:
+                self.misses += 1
+                generation = self._generation(product)
+        if price is None:
+            price = self.catalog.unit_price(product)
+            with self._lock:
+                if self._generation(product) == generation:
+                    self._store(product, price)
+        return price
+
+    def unit_prices(self, products):
+        prices = {}
+        missing = []
+        with self._lock:
+            for product in dict.fromkeys(products):
+                price = self._cached_price(product)
+                if price is None:
+                    missing.append(product)
+                else:
+                    prices[product] = price
+            self.misses += len(missing)
+            generations = [self._generation(product) for product in missing]
+        if missing:
+            fetched = self.catalog.unit_prices(missing)
+            with self._lock:
+                for product, generation in zip(missing, generations):
+                    if product in fetched and self._generation(product) == generation:
+                        self._store(product, fetched[product])
+            prices.update(fetched)
+        return prices
+
+    def invalidate(self, product):
+        with self._lock:
+            self._entries.pop(product, None)
+            self._generations[product] = self._generations.get(product, 0) + 1
+
+    def invalidate_all(self):
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._epoch += 1
+
+    @property
+    def size(self):
+        return len(self._entries)
+
+    def _generation(self, product):
+        return self._epoch, self._generations.get(product, 0)
+
+    def _cached_price(self, product):
+        entry = self._entries.get(product)
+        if entry is None:
+            return None
+        price, expires_at = entry
+        if expires_at is not None and self.clock() >= expires_at:
+            del self._entries[product]
+            return None
+        self._entries.move_to_end(product)
+        self.hits += 1
+        return price
+
+    def _store(self, product, price):
+        expires_at = None if self.ttl is None else self.clock() + self.ttl
+        self._entries[product] = (price, expires_at)
+        self._entries.move_to_end(product)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -1,3 +1,4 @@
+import asyncio
 
 class SupermarketCatalog:
 
@@ -7,3 +8,22 @@ class SupermarketCatalog:
     def unit_price(self, product):
         raise Exception("cannot be called from a unit test - it accesses the database")
 
+    def unit_prices(self, products):
+        return {product: self.unit_price(product) for product in products}
+
+    def product_with_name(self, name):
+        raise Exception("cannot be called from a unit test - it accesses the database")
+
+
+class AsyncSupermarketCatalog:
+
+    async def add_product(self, product, price):
+        raise Exception("cannot be called from a unit test - it accesses the price service")
+
+    async def unit_price(self, product):
+        raise Exception("cannot be called from a unit test - it accesses the price service")
+
+    async def unit_prices(self, products):
+        products = list(dict.fromkeys(products))
+        prices = await asyncio.gather(*(self.unit_price(product) for product in products))
+        return dict(zip(products, prices))
@@ -0,0 +1,60 @@
+from itertools import chain
+
+from receipt import LazyReceipt, ReceiptItem
+
+
+class BatchReceipt(LazyReceipt):
+    # Keeps the cart's lines and the batch's prices, and builds the
+    # receipt items from them, with the same multiplication, when read.
+
+    def __init__(self, lines, prices, discounts, total):
+        super().__init__(total)
+        self._batch = (lines, prices, discounts)
+
+    def _build(self):
+        lines, prices, discounts = self._batch
+        self._batch = None
+        items = []
+        for pq in lines:
+            price = prices[pq.product]
+            items.append(ReceiptItem(pq.product, pq.quantity, price, pq.quantity * price))
+        self.add_items(items)
+        for discount in discounts:
+            self.add_discount(discount)
+
+
+class CheckoutBatch:
+    # Prices every distinct product of the batch with one catalog call.
+    # receipts() then totals the carts in a single fused pass, applying
+    # the teller's compiled discount functions; receipt items are only
+    # built for the receipts whose items are read.
+
+    def __init__(self, carts, catalog):
+        self.carts = list(carts)
+        self.cart_count = len(self.carts)
+        self._prices = catalog.unit_prices(
+            dict.fromkeys(chain.from_iterable(cart.product_quantities for cart in self.carts)))
+        self.products = list(self._prices)
+        self.unit_prices = list(self._prices.values())
+
+    def receipts(self, discount_functions):
+        # The total adds line totals and then discounts in the order
+        # Receipt does, so it matches a serial checkout exactly.
+        prices = self._prices
+        offered = {p: discount_functions[p] for p in prices if p in discount_functions}
+        receipts = []
+        for cart in self.carts:
+            lines = list(cart.items)
+            total = 0
+            for pq in lines:
+                total += pq.quantity * prices[pq.product]
+            discounts = []
+            if offered:
+                for product, quantity in cart.product_quantities.items():
+                    if product in offered:
+                        discount = offered[product](product, quantity, prices[product])
+                        if discount:
+                            discounts.append(discount)
+                            total += discount.discount_amount
+            receipts.append(BatchReceipt(lines, prices, discounts, total))
+        return receipts
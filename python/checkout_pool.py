@@ -0,0 +1,135 @@
+import multiprocessing
+from multiprocessing.sharedctypes import RawArray
+from operator import attrgetter
+
+from compiled_offers import compile_offer
+from model_objects import Offer, Discount
+from receipt import LazyReceipt, ReceiptItem
+
+_get_product = attrgetter("product")
+_get_quantity = attrgetter("quantity")
+_prices = None
+_discount_functions = None
+
+
+def _init_worker(prices, offers):
+    global _prices, _discount_functions
+    _prices = prices
+    _discount_functions = {product_id: compile_offer(Offer(offer_type, product_id, argument))
+                           for product_id, offer_type, argument in offers}
+
+
+def _check_out_shard(shard):
+    # Does all the pricing: line totals, per-product totals, discounts and
+    # the receipt total, with the same float operations in the same order
+    # as Teller and Receipt. Only the discounts and the total go back.
+    prices = _prices
+    discount_functions = _discount_functions
+    results = []
+    for product_ids, quantities in shard:
+        totals = {}
+        total = 0
+        for i, q in zip(product_ids, quantities):
+            total += q * prices[i]
+            if i in totals:
+                totals[i] = totals[i] + q
+            else:
+                totals[i] = q
+        discounts = []
+        for i, q in totals.items():
+            discount_function = discount_functions.get(i)
+            if discount_function is not None:
+                discount = discount_function(i, q, prices[i])
+                if discount:
+                    discounts.append((i, discount.description, discount.discount_amount))
+                    total += discount.discount_amount
+        results.append((discounts, total))
+    return results
+
+
+class PooledReceipt(LazyReceipt):
+    # Holds a worker's compact result and only builds receipt items and
+    # discounts when they are first read, so the parent process does no
+    # per-line work for carts whose receipt is just totalled. Line totals
+    # are recomputed then with the worker's exact multiplication.
+
+    def __init__(self, products, prices, product_ids, quantities, discounts, total):
+        super().__init__(total)
+        self._pooled = (products, prices, product_ids, quantities, discounts)
+
+    def _build(self):
+        products, prices, product_ids, quantities, discounts = self._pooled
+        self._pooled = None
+        self.add_items([ReceiptItem(products[i], quantity, prices[i], quantity * prices[i])
+                        for i, quantity in zip(product_ids, quantities)])
+        for i, description, amount in discounts:
+            self.add_discount(Discount(products[i], description, amount))
+
+
+class CheckoutPool:
+    # Prices live in one shared array that every worker maps; offers are
+    # sent once per worker when it starts. Carts travel as product ids and
+    # quantities, workers do all of the pricing, and the parent only wraps
+    # each result in a PooledReceipt.
+
+    def __init__(self, teller, products, processes=None, chunk_size=256):
+        self.teller = teller
+        self.chunk_size = chunk_size
+        self.processes = processes
+        self._requested = list(products)
+        self._pool = None
+        self.refresh_prices()
+
+    def refresh_prices(self):
+        # Prices and offers are read from one snapshot. Workers compile
+        # their offers when they start, so new offers restart them; new
+        # prices only have to be written to the shared array.
+        snapshot = self.teller.snapshot
+        if self._pool is None or snapshot.offers != self._offers:
+            self._start_workers(snapshot)
+        prices = snapshot.unit_prices(self.products)
+        # Receipts already handed out keep the list they were priced with.
+        self._price_list = [prices[product] for product in self.products]
+        self._pricing_version = snapshot.version_of(self.products)
+        self.prices[:] = self._price_list
+
+    def _start_workers(self, snapshot):
+        if self._pool is not None:
+            self.close()
+        self._offers = snapshot.offers
+        self.products = list(dict.fromkeys([*self._requested, *snapshot.offers]))
+        self._product_ids = {product: i for i, product in enumerate(self.products)}
+        self.prices = RawArray('d', len(self.products))
+        offers = [(self._product_ids[product], offer.offer_type, offer.argument)
+                  for product, offer in snapshot.offers.items()]
+        self._pool = multiprocessing.Pool(self.processes, _init_worker, (self.prices, offers))
+
+    def checks_out_many(self, carts):
+        carts = list(carts)
+        shards = [[self._encode(cart) for cart in carts[start:start + self.chunk_size]]
+                  for start in range(0, len(carts), self.chunk_size)]
+        products = self.products
+        prices = self._price_list
+        version = self._pricing_version
+        receipts = []
+        for shard, results in zip(shards, self._pool.imap(_check_out_shard, shards)):
+            for (product_ids, quantities), (discounts, total) in zip(shard, results):
+                receipt = PooledReceipt(products, prices, product_ids, quantities, discounts, total)
+                receipt.pricing_version = version
+                receipts.append(receipt)
+        return receipts
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _encode(self, cart):
+        items = cart.items
+        return (list(map(self._product_ids.__getitem__, map(_get_product, items))),
+                list(map(_get_quantity, items)))
@@ -0,0 +1,60 @@
+import math
+
+from model_objects import SpecialOfferType, Discount
+
+
+def offer_description(offer):
+    if offer.offer_type == SpecialOfferType.THREE_FOR_TWO:
+        return "3 for 2"
+    if offer.offer_type == SpecialOfferType.TEN_PERCENT_DISCOUNT:
+        return str(offer.argument) + "% off"
+    if offer.offer_type == SpecialOfferType.TWO_FOR_AMOUNT:
+        return "2 for " + str(offer.argument)
+    return "5 for " + str(offer.argument)
+
+
+def compile_offer(offer):
+    description = offer_description(offer)
+    argument = offer.argument
+
+    if offer.offer_type == SpecialOfferType.THREE_FOR_TWO:
+        def discount(product, quantity, unit_price):
+            quantity_as_int = int(quantity)
+            if quantity_as_int > 2:
+                discount_amount = quantity * unit_price - (
+                            (math.floor(quantity_as_int / 3) * 2 * unit_price) + quantity_as_int % 3 * unit_price)
+                return Discount(product, description, -discount_amount)
+            return None
+
+    elif offer.offer_type == SpecialOfferType.TEN_PERCENT_DISCOUNT:
+        def discount(product, quantity, unit_price):
+            return Discount(product, description, -quantity * unit_price * argument / 100.0)
+
+    elif offer.offer_type == SpecialOfferType.TWO_FOR_AMOUNT:
+        def discount(product, quantity, unit_price):
+            quantity_as_int = int(quantity)
+            if quantity_as_int >= 2:
+                total = argument * (quantity_as_int / 2) + quantity_as_int % 2 * unit_price
+                discount_n = unit_price * quantity - total
+                return Discount(product, description, -discount_n)
+            return None
+
+    elif offer.offer_type == SpecialOfferType.FIVE_FOR_AMOUNT:
+        def discount(product, quantity, unit_price):
+            quantity_as_int = int(quantity)
+            if quantity_as_int >= 5:
+                discount_total = unit_price * quantity - (
+                            argument * math.floor(quantity_as_int / 5) + quantity_as_int % 5 * unit_price)
+                return Discount(product, description, -discount_total)
+            return None
+
+    else:
+        def discount(product, quantity, unit_price):
+            return None
+
+    discount.offer_type = offer.offer_type
+    return discount
+
+
+def compile_offers(offers):
+    return {product: compile_offer(offer) for product, offer in offers.items()}
@@ -0,0 +1,186 @@
+from compiled_offers import offer_description
+from model_objects import ProductUnit, SpecialOfferType, Discount
+from receipt import Receipt, ReceiptItem
+from receipt_printer import ReceiptPrinter
+from teller import Teller
+
+# Money is held as integer cents and kilo quantities as integer grams, so
+# receipt totals are exact. Rounding happens once per line or discount.
+
+GRAMS_PER_KILO = 1000
+
+
+def round_div(numerator, denominator):
+    quotient, remainder = divmod(abs(numerator), denominator)
+    if remainder * 2 >= denominator:
+        quotient += 1
+    return quotient if numerator >= 0 else -quotient
+
+
+def to_cents(price):
+    return round(price * 100)
+
+
+def to_units(product, quantity):
+    if product.unit == ProductUnit.KILO:
+        return round(quantity * GRAMS_PER_KILO)
+    return round(quantity)
+
+
+def line_cents(product, units, unit_price_cents):
+    if product.unit == ProductUnit.KILO:
+        return round_div(units * unit_price_cents, GRAMS_PER_KILO)
+    return units * unit_price_cents
+
+
+def whole_items(product, units):
+    if product.unit == ProductUnit.KILO:
+        return units // GRAMS_PER_KILO
+    return units
+
+
+def compile_fixed_point_offer(offer):
+    description = offer_description(offer)
+
+    if offer.offer_type == SpecialOfferType.THREE_FOR_TWO:
+        def discount_cents(full, items, unit_price):
+            if items > 2:
+                return full - ((items // 3) * 2 + items % 3) * unit_price
+            return None
+
+    elif offer.offer_type == SpecialOfferType.TEN_PERCENT_DISCOUNT:
+        basis_points = round(offer.argument * 100)
+
+        def discount_cents(full, items, unit_price):
+            return round_div(full * basis_points, 10000)
+
+    elif offer.offer_type == SpecialOfferType.TWO_FOR_AMOUNT:
+        bundle_price = to_cents(offer.argument)
+
+        # Same rule as compile_offer: half the bundle price per item, plus
+        # the unit price for an odd one.
+        def discount_cents(full, items, unit_price):
+            if items >= 2:
+                return full - (round_div(bundle_price * items, 2) + items % 2 * unit_price)
+            return None
+
+    elif offer.offer_type == SpecialOfferType.FIVE_FOR_AMOUNT:
+        bundle_price = to_cents(offer.argument)
+
+        def discount_cents(full, items, unit_price):
+            if items >= 5:
+                return full - (bundle_price * (items // 5) + items % 5 * unit_price)
+            return None
+
+    else:
+        def discount_cents(full, items, unit_price):
+            return None
+
+    def discount(product, units, unit_price_cents):
+        full = line_cents(product, units, unit_price_cents)
+        amount = discount_cents(full, whole_items(product, units), unit_price_cents)
+        if amount is None:
+            return None
+        return Discount(product, description, -amount)
+
+    discount.offer_type = offer.offer_type
+    return discount
+
+
+class FixedPointTeller(Teller):
+
+    compile_offer = staticmethod(compile_fixed_point_offer)
+
+    def __init__(self, catalog, stats=None):
+        super().__init__(catalog, stats)
+        self._cents = (None, {})
+
+    def snapshot_cents(self, snapshot):
+        # Pinned snapshot prices are converted to cents once per snapshot
+        # rather than once per checkout.
+        cents_snapshot, cents = self._cents
+        if cents_snapshot is not snapshot:
+            cents = {p: to_cents(price) for p, price in snapshot.prices.items()}
+            self._cents = (snapshot, cents)
+        return cents
+
+    def price_cart(self, the_cart, unit_prices, snapshot=None):
+        stats = self.stats
+        if snapshot is None:
+            snapshot = self.snapshot
+        if stats is not None:
+            start = stats.clock()
+        receipt = Receipt()
+        receipt.pricing_version = snapshot.version_of(unit_prices)
+        cents = self.snapshot_cents(snapshot)
+        unit_prices = {p: cents[p] if p in cents else to_cents(price) for p, price in unit_prices.items()}
+        items = []
+        product_units = {}
+        kilo = ProductUnit.KILO
+        for pq in the_cart.items:
+            p = pq.product
+            unit_price = unit_prices[p]
+            if p.unit is kilo:
+                units = round(pq.quantity * GRAMS_PER_KILO)
+                if units >= 0:
+                    total = (units * unit_price + GRAMS_PER_KILO // 2) // GRAMS_PER_KILO
+                else:
+                    total = round_div(units * unit_price, GRAMS_PER_KILO)
+            else:
+                units = round(pq.quantity)
+                total = units * unit_price
+            items.append(ReceiptItem(p, units, unit_price, total))
+            if p in product_units:
+                product_units[p] += units
+            else:
+                product_units[p] = units
+        receipt.add_items(items)
+        if stats is not None:
+            stats.record_phase("line_pricing", stats.clock() - start)
+            start = stats.clock()
+
+        discount_functions = snapshot.discount_functions
+        for p, units in product_units.items():
+            discount_function = discount_functions.get(p)
+            if discount_function is not None:
+                discount = discount_function(p, units, unit_prices[p])
+                if discount:
+                    receipt.add_discount(discount)
+                    if stats is not None:
+                        stats.record_discount(discount_function.offer_type)
+        if stats is not None:
+            stats.record_phase("offer_evaluation", stats.clock() - start)
+
+        return receipt
+
+    def receipt_unit_prices(self, snapshot, products):
+        cents = self.snapshot_cents(snapshot)
+        return {p: cents[p] if p in cents else to_cents(price)
+                for p, price in snapshot.unit_prices(products).items()}
+
+    def price_line(self, product, quantity, unit_price):
+        units = to_units(product, quantity)
+        return units, line_cents(product, units, unit_price)
+
+    def checks_out_many(self, carts):
+        return [self.checks_out_articles_from(cart) for cart in carts]
+
+
+class FixedPointReceiptPrinter(ReceiptPrinter):
+
+    def print_price(self, cents):
+        whole, fraction = divmod(abs(cents), 100)
+        sign = "-" if cents < 0 else ""
+        return f"{sign}{whole}.{fraction:02d}"
+
+    def print_quantity(self, item):
+        if ProductUnit.EACH == item.product.unit:
+            return str(item.quantity)
+        kilos, grams = divmod(abs(item.quantity), GRAMS_PER_KILO)
+        sign = "-" if item.quantity < 0 else ""
+        return f"{sign}{kilos}.{grams:03d}"
+
+    def is_single_unit(self, item):
+        if ProductUnit.KILO == item.product.unit:
+            return item.quantity == GRAMS_PER_KILO
+        return item.quantity == 1
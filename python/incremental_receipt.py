@@ -0,0 +1,52 @@
+from bisect import bisect_left
+
+from receipt import Receipt
+
+
+class IncrementalReceipt(Receipt):
+    # A receipt that Teller.checks_out_incrementally patches in place. It
+    # remembers the snapshot it was first priced with, how many cart lines
+    # it has priced, the unit price and the total quantity of each product,
+    # and keeps at most one discount per product, ordered by the product's
+    # first scan like a full checkout would.
+
+    def __init__(self):
+        super().__init__()
+        self.snapshot = None
+        self.scans_priced = 0
+        self.unit_prices = {}
+        self.product_quantities = {}
+        self._positions = {}
+        self._discount_positions = []
+        self._discount_total = 0
+
+    def total_price(self):
+        return self._items_total + self._discount_total
+
+    def add_product(self, product, quantity, price, total_price):
+        super().add_product(product, quantity, price, total_price)
+        if product in self._positions:
+            self.product_quantities[product] = self.product_quantities[product] + quantity
+        else:
+            self._positions[product] = len(self._positions)
+            self.product_quantities[product] = quantity
+
+    def add_discount(self, discount):
+        self.set_product_discount(discount.product, discount)
+
+    def set_product_discount(self, product, discount):
+        position = self._positions[product]
+        positions = self._discount_positions
+        index = bisect_left(positions, position)
+        if index < len(positions) and positions[index] == position:
+            self._discount_total -= self._discounts[index].discount_amount
+            if discount:
+                self._discounts[index] = discount
+            else:
+                del self._discounts[index]
+                del positions[index]
+        elif discount:
+            self._discounts.insert(index, discount)
+            positions.insert(index, position)
+        if discount:
+            self._discount_total += discount.discount_amount
@@ -0,0 +1,131 @@
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class LatencyHistogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def merge(self, other):
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.sum += other.sum
+
+    def cumulative_counts(self):
+        total = 0
+        for count in self.counts:
+            total += count
+            yield total
+
+
+class StatsShard:
+    # One thread's counters; only the owning thread writes to them.
+    def __init__(self, phases, buckets):
+        self.phases = {phase: LatencyHistogram(buckets) for phase in phases}
+        self.catalog_requests = 0
+        self.catalog_lookups = 0
+        self.discounts_applied = {}
+
+
+class CheckoutStats:
+    # Passed to Teller, ShoppingCart.handle_offers and ReceiptPrinter to turn
+    # instrumentation on; with no stats object the hot paths only pay for an
+    # "is None" check. Each thread records into a shard of its own, so one
+    # stats object can be shared by checkouts on many threads without a
+    # lock per record; readers add the shards up.
+    PHASES = ("catalog_lookup", "line_pricing", "offer_evaluation", "rendering", "checkout")
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.clock = perf_counter
+        self.buckets = buckets
+        self._shards = []
+        self._local = threading.local()
+        # Only taken when a thread records for the first time.
+        self._lock = threading.Lock()
+
+    def record_phase(self, phase, seconds):
+        self._shard().phases[phase].observe(seconds)
+
+    def record_catalog_lookup(self, products):
+        shard = self._shard()
+        shard.catalog_requests += 1
+        shard.catalog_lookups += products
+
+    def record_discount(self, offer_type):
+        discounts_applied = self._shard().discounts_applied
+        discounts_applied[offer_type] = discounts_applied.get(offer_type, 0) + 1
+
+    @property
+    def phases(self):
+        phases = {phase: LatencyHistogram(self.buckets) for phase in self.PHASES}
+        for shard in self._all_shards():
+            for phase, histogram in shard.phases.items():
+                phases[phase].merge(histogram)
+        return phases
+
+    @property
+    def catalog_requests(self):
+        return sum(shard.catalog_requests for shard in self._all_shards())
+
+    @property
+    def catalog_lookups(self):
+        return sum(shard.catalog_lookups for shard in self._all_shards())
+
+    @property
+    def discounts_applied(self):
+        discounts_applied = {}
+        for shard in self._all_shards():
+            for offer_type, count in list(shard.discounts_applied.items()):
+                discounts_applied[offer_type] = discounts_applied.get(offer_type, 0) + count
+        return discounts_applied
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = StatsShard(self.PHASES, self.buckets)
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def _all_shards(self):
+        with self._lock:
+            return list(self._shards)
+
+    def to_prometheus(self, prefix="supermarket"):
+        lines = [
+            f"# HELP {prefix}_checkout_phase_seconds Time spent in each checkout phase.",
+            f"# TYPE {prefix}_checkout_phase_seconds histogram",
+        ]
+        for phase, histogram in self.phases.items():
+            bounds = [*(repr(bound) for bound in histogram.buckets), "+Inf"]
+            for bound, count in zip(bounds, histogram.cumulative_counts()):
+                lines.append(f'{prefix}_checkout_phase_seconds_bucket{{phase="{phase}",le="{bound}"}} {count}')
+            lines.append(f'{prefix}_checkout_phase_seconds_sum{{phase="{phase}"}} {histogram.sum!r}')
+            lines.append(f'{prefix}_checkout_phase_seconds_count{{phase="{phase}"}} {histogram.count}')
+
+        lines += [
+            f"# HELP {prefix}_catalog_requests_total Calls made to the catalog.",
+            f"# TYPE {prefix}_catalog_requests_total counter",
+            f"{prefix}_catalog_requests_total {self.catalog_requests}",
+            f"# HELP {prefix}_catalog_lookups_total Product prices requested from the catalog.",
+            f"# TYPE {prefix}_catalog_lookups_total counter",
+            f"{prefix}_catalog_lookups_total {self.catalog_lookups}",
+            f"# HELP {prefix}_discounts_applied_total Discounts added to receipts per offer type.",
+            f"# TYPE {prefix}_discounts_applied_total counter",
+        ]
+        for offer_type, count in self.discounts_applied.items():
+            lines.append(f'{prefix}_discounts_applied_total{{offer_type="{offer_type.name}"}} {count}')
+        return "\n".join(lines) + "\n"
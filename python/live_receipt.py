@@ -0,0 +1,36 @@
+from incremental_receipt import IncrementalReceipt
+
+
+class LiveReceipt:
+    # Observes a cart and keeps an IncrementalReceipt up to date as items
+    # are scanned or voided, so a display can show line totals, discounts
+    # and the grand total without re-running the checkout. on_change, if
+    # given, is called with the live receipt after every update.
+
+    def __init__(self, teller, cart, on_change=None):
+        self.teller = teller
+        self.cart = cart
+        self.on_change = on_change
+        self.receipt = teller.checks_out_incrementally(cart, IncrementalReceipt())
+        cart.add_observer(self)
+
+    @property
+    def items(self):
+        return self.receipt.items
+
+    @property
+    def discounts(self):
+        return self.receipt.discounts
+
+    def total_price(self):
+        return self.receipt.total_price()
+
+    def item_added(self, product, quantity):
+        self.teller.checks_out_incrementally(self.cart, self.receipt)
+        if self.on_change is not None:
+            self.on_change(self)
+
+    def finish(self):
+        # Stops observing the cart and hands over the receipt for payment.
+        self.cart.remove_observer(self)
+        return self.receipt
@@ -2,12 +2,16 @@ from enum import Enum
 
 
 class Product:
+    __slots__ = ("name", "unit")
+
     def __init__(self, name, unit):
         self.name = name
         self.unit = unit
 
 
 class ProductQuantity:
+    __slots__ = ("product", "quantity")
+
     def __init__(self, product, quantity):
         self.product = product
         self.quantity = quantity
@@ -25,6 +29,8 @@ class SpecialOfferType(Enum):
     FIVE_FOR_AMOUNT = 4
 
 class Offer:
+    __slots__ = ("offer_type", "product", "argument")
+
     def __init__(self, offer_type, product, argument):
         self.offer_type = offer_type
         self.product = product
@@ -32,6 +38,8 @@ class Offer:
 
 
 class Discount:
+    __slots__ = ("product", "description", "discount_amount")
+
     def __init__(self, product, description, discount_amount):
         self.product = product
         self.description = description
@@ -0,0 +1,59 @@
+from types import MappingProxyType
+
+
+class PricingSnapshot:
+    # An immutable view of the prices and offers a teller checks out with.
+    # Changes build a new snapshot with the next version; the teller swaps
+    # its reference in one assignment, so a checkout that read the old
+    # snapshot finishes with it. Products without a pinned price are read
+    # from the catalog once per checkout, so catalog changes still reach
+    # the next checkout; only receipts priced entirely from pinned prices
+    # record the version, since only then does it identify their prices.
+    __slots__ = ("version", "catalog", "prices", "offers", "discount_functions")
+
+    def __init__(self, catalog, version=0, prices=None, offers=None, discount_functions=None):
+        self.version = version
+        self.catalog = catalog
+        self.prices = MappingProxyType(prices or {})
+        self.offers = MappingProxyType(offers or {})
+        self.discount_functions = MappingProxyType(discount_functions or {})
+
+    def with_offer(self, offer, discount_function):
+        return PricingSnapshot(self.catalog, self.version + 1, dict(self.prices),
+                               {**self.offers, offer.product: offer},
+                               {**self.discount_functions, offer.product: discount_function})
+
+    def with_prices(self, prices):
+        return PricingSnapshot(self.catalog, self.version + 1, {**self.prices, **prices},
+                               dict(self.offers), dict(self.discount_functions))
+
+    def unit_price(self, product):
+        return self.unit_prices([product])[product]
+
+    def unit_prices(self, products):
+        unit_prices, missing = self.known_prices(products)
+        if missing:
+            unit_prices.update(self.catalog.unit_prices(missing))
+        return unit_prices
+
+    def known_prices(self, products):
+        # Returns the pinned prices of products and the products that still
+        # have to be read from the catalog.
+        prices = self.prices
+        known = {}
+        missing = []
+        for p in dict.fromkeys(products):
+            if p in prices:
+                known[p] = prices[p]
+            else:
+                missing.append(p)
+        return known, missing
+
+    def version_of(self, products):
+        # The version a receipt of these products records: None when any of
+        # their prices was read live from the catalog.
+        prices = self.prices
+        for p in products:
+            if p not in prices:
+                return None
+        return self.version
@@ -1,5 +1,9 @@
+from collections.abc import Sequence
+
 
 class ReceiptItem:
+    __slots__ = ("product", "quantity", "price", "total_price")
+
     def __init__(self, product, quantity, price, total_price):
         self.product = product
         self.quantity = quantity
@@ -7,29 +11,125 @@ class ReceiptItem:
         self.total_price = total_price
 
 
+class SequenceView(Sequence):
+    def __init__(self, values):
+        self._values = values
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self._values)
+
+
 class Receipt:
     def __init__(self):
         self._items = []
         self._discounts = []
+        self._items_view = SequenceView(self._items)
+        self._discounts_view = SequenceView(self._discounts)
+        self._items_total = 0
+        self._total = 0
+        self.pricing_version = None
 
     def total_price(self):
-        total = 0
-        for item in self.items:
-            total += item.total_price
-        for discount in self.discounts:
-            total += discount.discount_amount
-        return total
+        # Items are summed before discounts; the running total only has to be
+        # rebuilt when a product is added after a discount.
+        if self._total is None:
+            total = self._items_total
+            for discount in self._discounts:
+                total += discount.discount_amount
+            self._total = total
+        return self._total
 
     def add_product(self, product, quantity, price, total_price):
         self._items.append(ReceiptItem(product, quantity, price, total_price))
+        self._items_total += total_price
+        if self._discounts:
+            self._total = None
+        else:
+            self._total = self._items_total
+
+    def add_items(self, items):
+        # Bulk add_product: the same running total, without a call per item.
+        total = self._items_total
+        for item in items:
+            total += item.total_price
+        self._items.extend(items)
+        self._items_total = total
+        self._total = None if self._discounts else total
 
     def add_discount(self, discount):
         self._discounts.append(discount)
+        if self._total is not None:
+            self._total += discount.discount_amount
+
+    @property
+    def items(self):
+        return self._items_view
+
+    @property
+    def discounts(self):
+        return self._discounts_view
+
+
+class LazyReceipt(Receipt):
+    # A receipt whose total is already known and whose items and discounts
+    # are only built, by the subclass's _build(), when they are first read.
+    # Checkouts that only total their receipts then allocate no per-line
+    # objects at all.
+
+    def __init__(self, total):
+        self._pending = True
+        self._total = total
+        self.pricing_version = None
+
+    def total_price(self):
+        if self._pending:
+            return self._total
+        return super().total_price()
+
+    def _materialize(self):
+        pricing_version = self.pricing_version
+        super().__init__()
+        self._pending = False
+        self.pricing_version = pricing_version
+        self._build()
+
+    def add_product(self, product, quantity, price, total_price):
+        if self._pending:
+            self._materialize()
+        super().add_product(product, quantity, price, total_price)
+
+    def add_items(self, items):
+        if self._pending:
+            self._materialize()
+        super().add_items(items)
+
+    def add_discount(self, discount):
+        if self._pending:
+            self._materialize()
+        super().add_discount(discount)
 
     @property
     def items(self):
-        return self._items[:]
+        if self._pending:
+            self._materialize()
+        return self._items_view
 
     @property
     def discounts(self):
-        return self._discounts[:]
+        if self._pending:
+            self._materialize()
+        return self._discounts_view
@@ -1,40 +1,62 @@
+import io
+
 from model_objects import ProductUnit
 
 class ReceiptPrinter:
 
-    def __init__(self, columns=40):
+    def __init__(self, columns=40, stats=None):
         self.columns = columns
-  
+        self.stats = stats
+
     def print_receipt(self, receipt):
-        result = ""
+        if self.stats is None:
+            return "".join(self.iter_lines(receipt))
+        start = self.stats.clock()
+        result = "".join(self.iter_lines(receipt))
+        self.stats.record_phase("rendering", self.stats.clock() - start)
+        return result
+
+    def iter_lines(self, receipt):
         for item in receipt.items:
-            receipt_item = self.print_receipt_item(item)
-            result += receipt_item
+            yield self.format_line_with_whitespace(item.product.name, self.print_price(item.total_price))
+            if not self.is_single_unit(item):
+                yield self.print_unit_price_line(item)
 
         for discount in receipt.discounts:
-            discount_presentation = self.print_discount(discount)
-            result += discount_presentation
+            yield self.print_discount(discount)
 
-        result += "\n"
-        result += self.present_total(receipt)
-        return str(result)
+        yield "\n"
+        yield self.present_total(receipt)
+
+    def write_receipt(self, receipt, stream):
+        if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+            stream.writelines(line.encode() for line in self.iter_lines(receipt))
+        else:
+            stream.writelines(self.iter_lines(receipt))
+
+    def print_many(self, receipts, stream):
+        separator = b"\n" if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)) else "\n"
+        for receipt in receipts:
+            self.write_receipt(receipt, stream)
+            stream.write(separator)
 
     def print_receipt_item(self, item):
         total_price_printed = self.print_price(item.total_price)
         name = item.product.name
         line = self.format_line_with_whitespace(name, total_price_printed)
-        if item.quantity != 1:
-            line += f"  {self.print_price(item.price)} * {self.print_quantity(item)}\n"
+        if not self.is_single_unit(item):
+            line += self.print_unit_price_line(item)
         return line
 
+    def is_single_unit(self, item):
+        return item.quantity == 1
+
+    def print_unit_price_line(self, item):
+        return f"  {self.print_price(item.price)} * {self.print_quantity(item)}\n"
+
     def format_line_with_whitespace(self, name, value):
-        line = name
         whitespace_size = self.columns - len(name) - len(value)
-        for i in range(whitespace_size):
-            line += " "
-        line += value
-        line += "\n"
-        return line
+        return name + " " * whitespace_size + value + "\n"
 
     def print_price(self, price):
         return "%.2f" % price
@@ -1,13 +1,14 @@
-import math
-
-from model_objects import ProductQuantity, SpecialOfferType, Discount
+from compiled_offers import compile_offers
+from model_objects import ProductQuantity
 
 
 class ShoppingCart:
+    # Not locked: a cart is filled and checked out by one thread at a time.
 
     def __init__(self):
         self._items = []
         self._product_quantities = {}
+        self._observers = []
 
     @property
     def items(self):
@@ -26,43 +27,41 @@ class ShoppingCart:
             self._product_quantities[product] = self._product_quantities[product] + quantity
         else:
             self._product_quantities[product] = quantity
+        for observer in self._observers:
+            observer.item_added(product, quantity)
 
-    def handle_offers(self, receipt, offers, catalog):
-        for p in self._product_quantities.keys():
-            quantity = self._product_quantities[p]
-            if p in offers.keys():
-                offer = offers[p]
-                unit_price = catalog.unit_price(p)
-                quantity_as_int = int(quantity)
-                discount = None
-                x = 1
-                if offer.offer_type == SpecialOfferType.THREE_FOR_TWO:
-                    x = 3
-
-                elif offer.offer_type == SpecialOfferType.TWO_FOR_AMOUNT:
-                    x = 2
-                    if quantity_as_int >= 2:
-                        total = offer.argument * (quantity_as_int / x) + quantity_as_int % 2 * unit_price
-                        discount_n = unit_price * quantity - total
-                        discount = Discount(p, "2 for " + str(offer.argument), -discount_n)
-
-                if offer.offer_type == SpecialOfferType.FIVE_FOR_AMOUNT:
-                    x = 5
+    def void_item(self, product, quantity=1.0):
+        # A void is recorded as a negative line, as on a till roll, so the
+        # scanned lines stay append-only.
+        if quantity <= 0:
+            raise ValueError("quantity must be positive")
+        if quantity > self.product_quantities.get(product, 0):
+            raise ValueError(f"cannot void more {product.name} than is in the cart")
+        self.add_item_quantity(product, -quantity)
 
-                number_of_x = math.floor(quantity_as_int / x)
-                if offer.offer_type == SpecialOfferType.THREE_FOR_TWO and quantity_as_int > 2:
-                    discount_amount = quantity * unit_price - (
-                                (number_of_x * 2 * unit_price) + quantity_as_int % 3 * unit_price)
-                    discount = Discount(p, "3 for 2", -discount_amount)
+    def add_observer(self, observer):
+        self._observers.append(observer)
 
-                if offer.offer_type == SpecialOfferType.TEN_PERCENT_DISCOUNT:
-                    discount = Discount(p, str(offer.argument) + "% off",
-                                        -quantity * unit_price * offer.argument / 100.0)
+    def remove_observer(self, observer):
+        self._observers.remove(observer)
 
-                if offer.offer_type == SpecialOfferType.FIVE_FOR_AMOUNT and quantity_as_int >= 5:
-                    discount_total = unit_price * quantity - (
-                                offer.argument * number_of_x + quantity_as_int % 5 * unit_price)
-                    discount = Discount(p, str(x) + " for " + str(offer.argument), -discount_total)
+    def handle_offers(self, receipt, offers, catalog, stats=None):
+        cart_offers = {p: offers[p] for p in self._product_quantities if p in offers}
+        unit_prices = catalog.unit_prices(cart_offers)
+        if stats is not None:
+            stats.record_catalog_lookup(len(cart_offers))
+        self.apply_discounts(receipt, compile_offers(cart_offers), unit_prices, stats)
 
+    def apply_discounts(self, receipt, discount_functions, unit_prices, stats=None):
+        if stats is not None:
+            start = stats.clock()
+        for p, quantity in self._product_quantities.items():
+            discount_function = discount_functions.get(p)
+            if discount_function is not None:
+                discount = discount_function(p, quantity, unit_prices[p])
                 if discount:
                     receipt.add_discount(discount)
+                    if stats is not None:
+                        stats.record_discount(discount_function.offer_type)
+        if stats is not None:
+            stats.record_phase("offer_evaluation", stats.clock() - start)
@@ -0,0 +1,118 @@
+import itertools
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from catalog import SupermarketCatalog
+from model_objects import Product, ProductUnit
+
+# The name is the primary key of a WITHOUT ROWID table, so lookups by name
+# go straight to the b-tree that also holds the price.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    name TEXT PRIMARY KEY,
+    unit INTEGER NOT NULL,
+    price REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+SELECT_PRICE = "SELECT price FROM products WHERE name = ?"
+SELECT_PRODUCT = "SELECT unit FROM products WHERE name = ?"
+UPSERT_PRODUCT = "INSERT OR REPLACE INTO products (name, unit, price) VALUES (?, ?, ?)"
+
+# Stays under SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds.
+MAX_PARAMETERS = 900
+
+_memory_databases = itertools.count()
+
+
+class SqliteCatalog(SupermarketCatalog):
+
+    def __init__(self, path=":memory:", pool_size=4):
+        if path == ":memory:":
+            # Pooled connections must all see the same in-memory database.
+            path = f"file:supermarket-catalog-{next(_memory_databases)}?mode=memory&cache=shared"
+        self.path = path
+        self.pool_size = pool_size
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        # Products hash by identity, so every lookup by name has to return
+        # the same object, as FakeCatalog.products does.
+        self.products = {}
+        # Holding one connection open keeps an in-memory database alive.
+        self._keeper = self._connect()
+        self._keeper.execute(SCHEMA)
+        self._idle.put(self._keeper)
+
+    def add_product(self, product, price):
+        self.add_products([(product, price)])
+
+    def add_products(self, product_prices):
+        product_prices = list(product_prices)
+        rows = ((product.name, product.unit.value, price) for product, price in product_prices)
+        with self._connection() as connection:
+            with connection:
+                connection.executemany(UPSERT_PRODUCT, rows)
+        for product, _ in product_prices:
+            self.products[product.name] = product
+
+    def unit_price(self, product):
+        with self._connection() as connection:
+            row = connection.execute(SELECT_PRICE, (product.name,)).fetchone()
+        if row is None:
+            raise KeyError(product.name)
+        return row[0]
+
+    def unit_prices(self, products):
+        products = list(dict.fromkeys(products))
+        by_name = {}
+        with self._connection() as connection:
+            for start in range(0, len(products), MAX_PARAMETERS):
+                names = [product.name for product in products[start:start + MAX_PARAMETERS]]
+                placeholders = ",".join("?" * len(names))
+                by_name.update(connection.execute(
+                    f"SELECT name, price FROM products WHERE name IN ({placeholders})", names))
+        return {product: by_name[product.name] for product in products}
+
+    def product_with_name(self, name):
+        product = self.products.get(name)
+        if product is not None:
+            return product
+        with self._connection() as connection:
+            row = connection.execute(SELECT_PRODUCT, (name,)).fetchone()
+        if row is None:
+            return None
+        return self.products.setdefault(name, Product(name, ProductUnit(row[0])))
+
+    def close(self):
+        with self._lock:
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+                self._opened -= 1
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, uri=self.path.startswith("file:"),
+                                     check_same_thread=False, cached_statements=256)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        self._opened += 1
+        return connection
+
+    @contextmanager
+    def _connection(self):
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                connection = self._connect() if self._opened < self.pool_size else None
+            if connection is None:
+                connection = self._idle.get()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
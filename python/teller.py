@@ -1,26 +1,143 @@
+import threading
+
+from checkout_batch import CheckoutBatch
+from compiled_offers import compile_offer
+from incremental_receipt import IncrementalReceipt
 from model_objects import Offer
+from pricing_snapshot import PricingSnapshot
 from receipt import Receipt
 
 
 class Teller:
+    # One teller can be shared by any number of threads. Checkouts only
+    # read the current PricingSnapshot, which is never modified, and
+    # updates replace it; carts and receipts belong to a single checkout.
+
+    compile_offer = staticmethod(compile_offer)
+
+    def __init__(self, catalog, stats=None):
+        self.stats = stats
+        self.snapshot = PricingSnapshot(catalog)
+        # Only serializes writers; checkouts read self.snapshot once and
+        # never take the lock.
+        self._update_lock = threading.Lock()
+
+    @property
+    def catalog(self):
+        return self.snapshot.catalog
+
+    @property
+    def offers(self):
+        return self.snapshot.offers
 
-    def __init__(self, catalog):
-        self.catalog = catalog
-        self.offers = {}
+    @property
+    def discount_functions(self):
+        return self.snapshot.discount_functions
 
     def add_special_offer(self, offer_type, product, argument):
-        self.offers[product] = Offer(offer_type, product, argument)
+        offer = Offer(offer_type, product, argument)
+        discount_function = self.compile_offer(offer)
+        with self._update_lock:
+            self.snapshot = self.snapshot.with_offer(offer, discount_function)
+
+    def update_prices(self, prices):
+        with self._update_lock:
+            self.snapshot = self.snapshot.with_prices(prices)
+
+    def load_prices(self, products):
+        self.update_prices(self.catalog.unit_prices(products))
+
+    def product_with_name(self, name):
+        return self.catalog.product_with_name(name)
 
     def checks_out_articles_from(self, the_cart):
+        stats = self.stats
+        snapshot = self.snapshot
+        if stats is None:
+            unit_prices = snapshot.unit_prices(the_cart.product_quantities.keys())
+            return self.price_cart(the_cart, unit_prices, snapshot)
+
+        start = stats.clock()
+        unit_prices = snapshot.unit_prices(the_cart.product_quantities.keys())
+        stats.record_catalog_lookup(len(the_cart.product_quantities))
+        stats.record_phase("catalog_lookup", stats.clock() - start)
+        receipt = self.price_cart(the_cart, unit_prices, snapshot)
+        stats.record_phase("checkout", stats.clock() - start)
+        return receipt
+
+    def price_cart(self, the_cart, unit_prices, snapshot=None):
+        stats = self.stats
+        if snapshot is None:
+            snapshot = self.snapshot
+        if stats is not None:
+            start = stats.clock()
         receipt = Receipt()
+        receipt.pricing_version = snapshot.version_of(unit_prices)
         product_quantities = the_cart.items
         for pq in product_quantities:
             p = pq.product
             quantity = pq.quantity
-            unit_price = self.catalog.unit_price(p)
+            unit_price = unit_prices[p]
             price = quantity * unit_price
             receipt.add_product(p, quantity, unit_price, price)
+        if stats is not None:
+            stats.record_phase("line_pricing", stats.clock() - start)
 
-        the_cart.handle_offers(receipt, self.offers, self.catalog)
+        the_cart.apply_discounts(receipt, snapshot.discount_functions, unit_prices, stats)
 
         return receipt
+
+    def checks_out_incrementally(self, the_cart, receipt=None):
+        # Prices only the cart lines added since the receipt was last
+        # refreshed and re-evaluates offers for just those products. Every
+        # refresh uses the snapshot the receipt was first priced with, so
+        # prices and offers published later apply to the next receipt.
+        if receipt is None:
+            receipt = IncrementalReceipt()
+        if receipt.snapshot is None:
+            receipt.snapshot = self.snapshot
+            receipt.pricing_version = receipt.snapshot.version
+        snapshot = receipt.snapshot
+        new_lines = the_cart.items[receipt.scans_priced:]
+        changed = dict.fromkeys(pq.product for pq in new_lines)
+        unit_prices = receipt.unit_prices
+        missing = [p for p in changed if p not in unit_prices]
+        if missing:
+            unit_prices.update(self.receipt_unit_prices(snapshot, missing))
+            if snapshot.version_of(missing) is None:
+                receipt.pricing_version = None
+            if self.stats is not None:
+                self.stats.record_catalog_lookup(len(missing))
+
+        price_line = self.price_line
+        for pq in new_lines:
+            unit_price = unit_prices[pq.product]
+            quantity, total = price_line(pq.product, pq.quantity, unit_price)
+            receipt.add_product(pq.product, quantity, unit_price, total)
+        receipt.scans_priced += len(new_lines)
+
+        product_quantities = receipt.product_quantities
+        discount_functions = snapshot.discount_functions
+        for p in changed:
+            discount_function = discount_functions.get(p)
+            if discount_function is not None:
+                discount = discount_function(p, product_quantities[p], unit_prices[p])
+                receipt.set_product_discount(p, discount)
+        return receipt
+
+    def receipt_unit_prices(self, snapshot, products):
+        # Unit prices in the form receipt lines and offers use.
+        return snapshot.unit_prices(products)
+
+    def price_line(self, product, quantity, unit_price):
+        # The quantity and total price one receipt line records.
+        return quantity, quantity * unit_price
+
+    def checks_out_many(self, carts):
+        snapshot = self.snapshot
+        batch = CheckoutBatch(carts, snapshot)
+        receipts = batch.receipts(snapshot.discount_functions)
+        version = snapshot.version_of(batch.products)
+        for receipt in receipts:
+            receipt.pricing_version = version
+        return receipts
@@ -13,3 +13,5 @@ class FakeCatalog(SupermarketCatalog):
     def unit_price(self, product):
         return self.prices[product.name]
 
+    def product_with_name(self, name):
+        return self.products.get(name)
@@ -0,0 +1,71 @@
+import pytest
+from tests.fake_catalog import FakeCatalog
+from model_objects import Product, ProductUnit, SpecialOfferType, Offer
+from array_shopping_cart import ArrayShoppingCart
+from receipt import Receipt
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+
+class TestArrayShoppingCart:
+    TOOTHBRUSH = Product("toothbrush", ProductUnit.EACH)
+    APPLES = Product("apples", ProductUnit.KILO)
+
+    @pytest.fixture
+    def catalog(self):
+        catalog = FakeCatalog()
+        catalog.add_product(self.TOOTHBRUSH, 0.99)
+        catalog.add_product(self.APPLES, 1.99)
+        return catalog
+
+    @pytest.fixture
+    def cart(self):
+        return ArrayShoppingCart()
+
+    def test_valid_creation(self, cart):
+        assert len(cart.items) == 0
+        assert len(cart.product_quantities) == 0
+
+    def test_add_items(self, cart):
+        cart.add_item(self.TOOTHBRUSH)
+        cart.add_item_quantity(self.APPLES, 1.5)
+        cart.add_item(self.TOOTHBRUSH)
+
+        assert len(cart.items) == 3
+        assert [(pq.product, pq.quantity) for pq in cart.items] == \
+               [(self.TOOTHBRUSH, 1.0), (self.APPLES, 1.5), (self.TOOTHBRUSH, 1.0)]
+        assert cart.items[1].product == self.APPLES
+        assert cart.items[-1].product == self.TOOTHBRUSH
+        assert dict(cart.product_quantities) == {self.TOOTHBRUSH: 2.0, self.APPLES: 1.5}
+        assert self.APPLES in cart.product_quantities
+        assert Product("milk", ProductUnit.EACH) not in cart.product_quantities
+
+    def test_handle_offers(self, cart, catalog):
+        cart.add_item_quantity(self.TOOTHBRUSH, 3)
+        receipt = Receipt()
+        offers = {self.TOOTHBRUSH: Offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)}
+
+        cart.handle_offers(receipt, offers, catalog)
+
+        assert len(receipt.discounts) == 1
+        assert receipt.discounts[0].discount_amount == pytest.approx(-0.99)
+
+    def test_teller_checkout_matches_shopping_cart(self, catalog):
+        teller = Teller(catalog)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+        teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.APPLES, 20.0)
+        array_cart = ArrayShoppingCart()
+        cart = ShoppingCart()
+        for c in (array_cart, cart):
+            for _ in range(4):
+                c.add_item(self.TOOTHBRUSH)
+                c.add_item_quantity(self.APPLES, 0.5)
+
+        expected = teller.checks_out_articles_from(cart)
+        receipt = teller.checks_out_articles_from(array_cart)
+        batch_receipt, = teller.checks_out_many([array_cart])
+
+        for r in (receipt, batch_receipt):
+            assert len(r.items) == 8
+            assert [d.discount_amount for d in r.discounts] == [d.discount_amount for d in expected.discounts]
+            assert r.total_price() == expected.total_price()
@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+from catalog import AsyncSupermarketCatalog
+from model_objects import Product, ProductUnit, SpecialOfferType
+from async_teller import AsyncTeller, PriceLoader
+from shopping_cart import ShoppingCart
+
+
+class AsyncFakeCatalog(AsyncSupermarketCatalog):
+    def __init__(self):
+        self.prices = {}
+        self.requests = []
+
+    async def add_product(self, product, price):
+        self.prices[product.name] = price
+
+    async def unit_price(self, product):
+        await asyncio.sleep(0)
+        return self.prices[product.name]
+
+    async def unit_prices(self, products):
+        self.requests.append([p.name for p in products])
+        return await super().unit_prices(products)
+
+
+class PartialCatalog(AsyncFakeCatalog):
+    # Leaves unknown products out of the result instead of raising.
+    async def unit_prices(self, products):
+        self.requests.append([p.name for p in products])
+        return {p: self.prices[p.name] for p in products if p.name in self.prices}
+
+
+class TestAsyncTeller:
+    TOOTHBRUSH = Product("toothbrush", ProductUnit.EACH)
+    APPLES = Product("apples", ProductUnit.KILO)
+    RICE = Product("rice", ProductUnit.EACH)
+
+    @pytest.fixture
+    def catalog(self):
+        catalog = AsyncFakeCatalog()
+        catalog.prices = {"toothbrush": 0.99, "apples": 1.99, "rice": 2.49}
+        return catalog
+
+    def cart(self, *products):
+        cart = ShoppingCart()
+        for product in products:
+            cart.add_item(product)
+        return cart
+
+    def test_checkout(self, catalog):
+        teller = AsyncTeller(catalog)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+        cart = self.cart(self.TOOTHBRUSH, self.TOOTHBRUSH, self.APPLES, self.TOOTHBRUSH)
+
+        receipt = asyncio.run(teller.checks_out_articles_from(cart))
+
+        assert len(receipt.items) == 4
+        assert receipt.discounts[0].discount_amount == pytest.approx(-0.99)
+        assert receipt.total_price() == pytest.approx(3.97)
+        assert catalog.requests == [["toothbrush", "apples"]]
+
+    def test_concurrent_checkouts_share_one_lookup(self, catalog):
+        teller = AsyncTeller(catalog)
+        carts = [self.cart(self.TOOTHBRUSH, self.APPLES),
+                 self.cart(self.APPLES, self.RICE),
+                 self.cart(self.RICE)]
+
+        receipts = asyncio.run(teller.checks_out_many(carts))
+
+        assert [r.total_price() for r in receipts] == pytest.approx([2.98, 4.48, 2.49])
+        assert catalog.requests == [["toothbrush", "apples", "rice"]]
+        assert teller.price_loader.batches == 1
+
+    def test_lookup_errors_reach_every_waiting_checkout(self, catalog):
+        teller = AsyncTeller(catalog)
+        milk = Product("milk", ProductUnit.EACH)
+
+        async def check_out_both():
+            return await asyncio.gather(
+                teller.checks_out_articles_from(self.cart(milk)),
+                teller.checks_out_articles_from(self.cart(milk, self.RICE)),
+                return_exceptions=True)
+
+        results = asyncio.run(check_out_both())
+
+        assert all(isinstance(result, KeyError) for result in results)
+
+    def test_price_loader_coalesces_within_a_tick(self, catalog):
+        loader = PriceLoader(catalog)
+
+        async def load():
+            first = loader.load_many([self.APPLES, self.RICE])
+            second = loader.load_many([self.RICE, self.TOOTHBRUSH])
+            return await asyncio.gather(first, second)
+
+        first, second = asyncio.run(load())
+
+        assert first == {self.APPLES: 1.99, self.RICE: 2.49}
+        assert second == {self.RICE: 2.49, self.TOOTHBRUSH: 0.99}
+        assert loader.batches == 1
+
+    def test_cancelling_one_checkout_leaves_the_others(self, catalog):
+        teller = AsyncTeller(catalog)
+
+        async def cancel_first():
+            first = asyncio.ensure_future(teller.checks_out_articles_from(self.cart(self.APPLES)))
+            second = asyncio.ensure_future(teller.checks_out_articles_from(self.cart(self.APPLES, self.RICE)))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await asyncio.gather(first, second, return_exceptions=True)
+
+        first, second = asyncio.run(cancel_first())
+
+        assert isinstance(first, asyncio.CancelledError)
+        assert second.total_price() == pytest.approx(4.48)
+        assert catalog.requests == [["apples", "rice"]]
+
+    def test_products_missing_from_the_result_raise_key_error(self):
+        catalog = PartialCatalog()
+        catalog.prices = {"rice": 2.49}
+        loader = PriceLoader(catalog)
+        milk = Product("milk", ProductUnit.EACH)
+
+        async def load():
+            return await asyncio.wait_for(asyncio.gather(
+                loader.load(milk), loader.load(self.RICE), return_exceptions=True), timeout=1)
+
+        missing, rice = asyncio.run(load())
+
+        assert isinstance(missing, KeyError)
+        assert rice == 2.49
+
+    def test_catalog_changes_reach_the_next_checkout(self, catalog):
+        teller = AsyncTeller(catalog)
+        first = asyncio.run(teller.checks_out_articles_from(self.cart(self.APPLES)))
+        catalog.prices["apples"] = 5.00
+
+        second = asyncio.run(teller.checks_out_articles_from(self.cart(self.APPLES)))
+
+        assert (first.total_price(), second.total_price()) == (1.99, 5.00)
+        assert first.pricing_version is None
+        assert catalog.requests == [["apples"], ["apples"]]
+
+    def test_loaded_prices_are_pinned_in_the_snapshot(self, catalog):
+        teller = AsyncTeller(catalog)
+        asyncio.run(teller.load_prices([self.APPLES, self.RICE]))
+        catalog.prices["apples"] = 5.00
+
+        receipt = asyncio.run(teller.checks_out_articles_from(self.cart(self.APPLES, self.RICE)))
+
+        assert receipt.total_price() == pytest.approx(4.48)
+        assert receipt.pricing_version == teller.snapshot.version == 1
+        assert catalog.requests == [["apples", "rice"]]
+
+    def test_has_no_synchronous_checkouts(self, catalog):
+        teller = AsyncTeller(catalog)
+
+        assert not hasattr(teller, "checks_out_incrementally")
+        assert not hasattr(teller, "price_cart")
@@ -0,0 +1,51 @@
+from benchmarks import batch_benchmark, concurrency_benchmark, pool_benchmark
+from benchmarks.checkout_benchmarks import regressions, run
+from benchmarks.data_generator import SyntheticData
+from model_objects import ProductUnit
+
+
+class TestBenchmarks:
+
+    def test_synthetic_data(self):
+        data = SyntheticData(catalog_size=100, offers_density=0.25, kilo_share=0.5, seed=1)
+        cart = data.cart(40)
+
+        assert len(data.products) == 100
+        assert len(data.teller.offers) == 25
+        assert len(cart.items) == 40
+        assert all(pq.quantity == int(pq.quantity) for pq in cart.items if pq.product.unit == ProductUnit.EACH)
+
+    def test_run_records_every_benchmark_and_size(self):
+        results = run([10, 20], catalog_size=50, offers_density=0.5, kilo_share=0.3)
+
+        assert len(results) == 8
+        assert results["print_receipt[20]"]["lines"] == 20
+        assert results["handle_offers[10]"]["lines_per_second"] > 0
+
+    def test_regressions_against_baseline(self):
+        baseline = {"a[10]": {"lines_per_second": 100.0}, "b[10]": {"lines_per_second": 100.0}}
+        results = {"a[10]": {"lines_per_second": 85.0},
+                   "b[10]": {"lines_per_second": 50.0},
+                   "c[10]": {"lines_per_second": 1.0}}
+
+        assert regressions(results, baseline, tolerance=0.2) == {"b[10]": 0.5}
+
+    def test_batch_benchmark(self):
+        result = batch_benchmark.run(carts=50, lines=5, catalog_size=30, repeats=1)
+
+        assert result["carts"] == 50
+        assert result["speedup"] > 0
+
+    def test_pool_benchmark_matches_serial_totals(self):
+        result = pool_benchmark.run(carts=50, lines=5, catalog_size=30, processes=1)
+
+        assert result["carts"] == 50
+        assert result["mismatches"] == 0
+
+    def test_concurrency_benchmark_receipts_match_their_snapshot(self):
+        results = concurrency_benchmark.run([1, 3], checkouts_per_thread=100, lines=10, carts=8,
+                                            catalog_size=50, update_interval=0.0005, sample=50)
+
+        assert results["threads[3]"]["checkouts"] == 300
+        assert results["threads[1]"]["speedup"] == 1.0
+        assert all(result["inconsistent_receipts"] == 0 for result in results.values())
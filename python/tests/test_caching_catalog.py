@@ -0,0 +1,159 @@
+import pytest
+from tests.fake_catalog import FakeCatalog
+from model_objects import Product, ProductUnit
+from caching_catalog import CachingCatalog
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+
+class CountingCatalog(FakeCatalog):
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+
+    def unit_price(self, product):
+        self.lookups += 1
+        return super().unit_price(product)
+
+
+class UpdatedDuringFetch(CountingCatalog):
+    # Lets a test change a price while the cache is fetching it.
+    def __init__(self):
+        super().__init__()
+        self.during_fetch = None
+
+    def unit_price(self, product):
+        price = super().unit_price(product)
+        if self.during_fetch is not None:
+            during_fetch, self.during_fetch = self.during_fetch, None
+            during_fetch()
+        return price
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCachingCatalog:
+    TOOTHBRUSH = Product("toothbrush", ProductUnit.EACH)
+    APPLES = Product("apples", ProductUnit.KILO)
+    RICE = Product("rice", ProductUnit.EACH)
+
+    @pytest.fixture
+    def backing(self):
+        catalog = CountingCatalog()
+        catalog.add_product(self.TOOTHBRUSH, 0.99)
+        catalog.add_product(self.APPLES, 1.99)
+        catalog.add_product(self.RICE, 2.49)
+        return catalog
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    def test_repeated_lookups_hit_cache(self, backing):
+        catalog = CachingCatalog(backing)
+
+        assert catalog.unit_price(self.TOOTHBRUSH) == 0.99
+        assert catalog.unit_price(self.TOOTHBRUSH) == 0.99
+
+        assert backing.lookups == 1
+        assert (catalog.hits, catalog.misses, catalog.evictions) == (1, 1, 0)
+
+    def test_least_recently_used_entry_is_evicted(self, backing):
+        catalog = CachingCatalog(backing, max_size=2)
+        catalog.unit_price(self.TOOTHBRUSH)
+        catalog.unit_price(self.APPLES)
+        catalog.unit_price(self.TOOTHBRUSH)
+        catalog.unit_price(self.RICE)
+
+        assert catalog.size == 2
+        assert catalog.evictions == 1
+        catalog.unit_price(self.TOOTHBRUSH)
+        assert backing.lookups == 3
+        catalog.unit_price(self.APPLES)
+        assert backing.lookups == 4
+
+    def test_entries_expire_after_ttl(self, backing, clock):
+        catalog = CachingCatalog(backing, ttl=60, clock=clock)
+        catalog.unit_price(self.APPLES)
+
+        clock.now = 59
+        catalog.unit_price(self.APPLES)
+        assert backing.lookups == 1
+
+        clock.now = 60
+        catalog.unit_price(self.APPLES)
+        assert backing.lookups == 2
+
+    def test_invalidate(self, backing):
+        catalog = CachingCatalog(backing)
+        catalog.unit_price(self.TOOTHBRUSH)
+        catalog.unit_price(self.APPLES)
+
+        backing.add_product(self.TOOTHBRUSH, 1.29)
+        catalog.invalidate(self.TOOTHBRUSH)
+        assert catalog.unit_price(self.TOOTHBRUSH) == 1.29
+        assert catalog.unit_price(self.APPLES) == 1.99
+
+        catalog.invalidate_all()
+        assert catalog.size == 0
+
+    def test_add_product_invalidates_entry(self, backing):
+        catalog = CachingCatalog(backing)
+        catalog.unit_price(self.RICE)
+
+        catalog.add_product(self.RICE, 2.99)
+
+        assert catalog.unit_price(self.RICE) == 2.99
+
+    def test_unit_prices_only_fetches_misses(self, backing):
+        catalog = CachingCatalog(backing)
+        catalog.unit_price(self.TOOTHBRUSH)
+
+        prices = catalog.unit_prices([self.TOOTHBRUSH, self.APPLES, self.APPLES])
+
+        assert prices == {self.TOOTHBRUSH: 0.99, self.APPLES: 1.99}
+        assert backing.lookups == 2
+        assert (catalog.hits, catalog.misses) == (1, 2)
+
+    def test_teller_checkouts_reuse_cached_prices(self, backing):
+        teller = Teller(CachingCatalog(backing))
+        cart = ShoppingCart()
+        cart.add_item(self.TOOTHBRUSH)
+        cart.add_item_quantity(self.APPLES, 1.5)
+
+        teller.checks_out_articles_from(cart)
+        receipt = teller.checks_out_articles_from(cart)
+
+        assert backing.lookups == 2
+        assert receipt.total_price() == pytest.approx(3.975)
+
+    @pytest.mark.parametrize("bulk", [False, True])
+    def test_fetch_overlapping_an_update_does_not_store_the_old_price(self, bulk):
+        backing = UpdatedDuringFetch()
+        backing.add_product(self.APPLES, 1.99)
+        catalog = CachingCatalog(backing)
+        backing.during_fetch = lambda: catalog.add_product(self.APPLES, 2.49)
+
+        if bulk:
+            assert catalog.unit_prices([self.APPLES]) == {self.APPLES: 1.99}
+        else:
+            assert catalog.unit_price(self.APPLES) == 1.99
+
+        assert catalog.size == 0
+        assert catalog.unit_price(self.APPLES) == 2.49
+
+    def test_fetch_overlapping_invalidate_all_does_not_store(self):
+        backing = UpdatedDuringFetch()
+        backing.add_product(self.APPLES, 1.99)
+        catalog = CachingCatalog(backing)
+        backing.during_fetch = catalog.invalidate_all
+
+        catalog.unit_price(self.APPLES)
+
+        assert catalog.size == 0
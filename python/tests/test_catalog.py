@@ -0,0 +1,17 @@
+from tests.fake_catalog import FakeCatalog
+from model_objects import Product, ProductUnit
+
+
+class TestCatalog:
+
+    def test_unit_prices_falls_back_to_unit_price(self):
+        catalog = FakeCatalog()
+        toothbrush = Product("toothbrush", ProductUnit.EACH)
+        apples = Product("apples", ProductUnit.KILO)
+        catalog.add_product(toothbrush, 0.99)
+        catalog.add_product(apples, 1.99)
+
+        assert catalog.unit_prices([toothbrush, apples]) == {toothbrush: 0.99, apples: 1.99}
+
+    def test_unit_prices_of_no_products(self):
+        assert FakeCatalog().unit_prices([]) == {}
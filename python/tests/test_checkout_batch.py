@@ -0,0 +1,87 @@
+import pytest
+from tests.fake_catalog import FakeCatalog
+from model_objects import Product, ProductUnit, SpecialOfferType
+from checkout_batch import CheckoutBatch
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+
+class TestCheckoutBatch:
+    TOOTHBRUSH = Product("toothbrush", ProductUnit.EACH)
+    APPLES = Product("apples", ProductUnit.KILO)
+    RICE = Product("rice", ProductUnit.EACH)
+    TOOTHPASTE = Product("toothpaste", ProductUnit.EACH)
+    TOMATOES = Product("cherry tomatoes", ProductUnit.EACH)
+
+    @pytest.fixture
+    def teller(self):
+        catalog = FakeCatalog()
+        catalog.add_product(self.TOOTHBRUSH, 0.99)
+        catalog.add_product(self.APPLES, 1.99)
+        catalog.add_product(self.RICE, 2.49)
+        catalog.add_product(self.TOOTHPASTE, 1.79)
+        catalog.add_product(self.TOMATOES, 0.69)
+        teller = Teller(catalog)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+        teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.APPLES, 20.0)
+        teller.add_special_offer(SpecialOfferType.FIVE_FOR_AMOUNT, self.TOOTHPASTE, 7.49)
+        teller.add_special_offer(SpecialOfferType.TWO_FOR_AMOUNT, self.TOMATOES, 0.99)
+        return teller
+
+    @pytest.fixture
+    def carts(self):
+        carts = []
+        for n in range(1, 8):
+            cart = ShoppingCart()
+            cart.add_item_quantity(self.TOOTHBRUSH, n)
+            cart.add_item_quantity(self.APPLES, n * 0.5)
+            cart.add_item_quantity(self.TOOTHPASTE, n)
+            cart.add_item(self.RICE)
+            cart.add_item_quantity(self.TOMATOES, n)
+            cart.add_item(self.TOOTHBRUSH)
+            carts.append(cart)
+        carts.append(ShoppingCart())
+        return carts
+
+    def test_distinct_products_are_priced_once(self, teller):
+        cart = ShoppingCart()
+        cart.add_item(self.RICE)
+        cart.add_item_quantity(self.APPLES, 1.5)
+        cart.add_item(self.RICE)
+
+        batch = CheckoutBatch([ShoppingCart(), cart], teller.catalog)
+
+        assert batch.cart_count == 2
+        assert batch.products == [self.RICE, self.APPLES]
+        assert batch.unit_prices == [2.49, 1.99]
+
+    def test_unit_price_looked_up_once_per_product(self, teller, carts):
+        calls = []
+        unit_price = teller.catalog.unit_price
+        teller.catalog.unit_price = lambda p: calls.append(p) or unit_price(p)
+
+        CheckoutBatch(carts, teller.catalog)
+
+        assert len(calls) == 5
+
+    def test_receipts_match_single_cart_checkout(self, teller, carts):
+        receipts = teller.checks_out_many(carts)
+
+        assert len(receipts) == len(carts)
+        for cart, receipt in zip(carts, receipts):
+            expected = teller.checks_out_articles_from(cart)
+            assert [(i.product, i.quantity, i.price, i.total_price) for i in receipt.items] == \
+                   [(i.product, i.quantity, i.price, i.total_price) for i in expected.items]
+            assert [(d.product, d.description, d.discount_amount) for d in receipt.discounts] == \
+                   [(d.product, d.description, d.discount_amount) for d in expected.discounts]
+            assert receipt.total_price() == expected.total_price()
+
+    def test_receipt_items_are_those_checked_out(self, teller, carts):
+        expected = teller.checks_out_articles_from(carts[2])
+        receipt = teller.checks_out_many(carts)[2]
+        carts[2].add_item(self.RICE)
+
+        assert receipt.total_price() == expected.total_price()
+        assert [(i.product, i.quantity, i.total_price) for i in receipt.items] == \
+               [(i.product, i.quantity, i.total_price) for i in expected.items]
+        assert receipt.total_price() == expected.total_price()
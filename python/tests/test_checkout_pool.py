@@ -0,0 +1,66 @@
+import pytest
+from tests.fake_catalog import FakeCatalog
+from model_objects import Product, ProductUnit, SpecialOfferType
+from checkout_pool import CheckoutPool
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+
+class TestCheckoutPool:
+    TOOTHBRUSH = Product("toothbrush", ProductUnit.EACH)
+    APPLES = Product("apples", ProductUnit.KILO)
+    TOOTHPASTE = Product("toothpaste", ProductUnit.EACH)
+
+    @pytest.fixture
+    def teller(self):
+        catalog = FakeCatalog()
+        catalog.add_product(self.TOOTHBRUSH, 0.99)
+        catalog.add_product(self.APPLES, 1.99)
+        catalog.add_product(self.TOOTHPASTE, 1.79)
+        teller = Teller(catalog)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+        teller.add_special_offer(SpecialOfferType.FIVE_FOR_AMOUNT, self.TOOTHPASTE, 7.49)
+        return teller
+
+    @pytest.fixture
+    def carts(self):
+        carts = []
+        for n in range(1, 12):
+            cart = ShoppingCart()
+            cart.add_item_quantity(self.TOOTHBRUSH, n)
+            cart.add_item_quantity(self.APPLES, n * 0.25)
+            cart.add_item_quantity(self.TOOTHPASTE, n)
+            carts.append(cart)
+        return carts
+
+    def test_receipts_in_input_order_match_teller(self, teller, carts):
+        with CheckoutPool(teller, [self.APPLES], processes=2, chunk_size=3) as pool:
+            receipts = pool.checks_out_many(carts)
+
+        assert len(receipts) == len(carts)
+        for cart, receipt in zip(carts, receipts):
+            expected = teller.checks_out_articles_from(cart)
+            assert [(i.product, i.quantity, i.total_price) for i in receipt.items] == \
+                   [(i.product, i.quantity, i.total_price) for i in expected.items]
+            assert [(d.product, d.description, d.discount_amount) for d in receipt.discounts] == \
+                   [(d.product, d.description, d.discount_amount) for d in expected.discounts]
+
+    def test_refresh_prices_updates_workers(self, teller, carts):
+        with CheckoutPool(teller, [self.APPLES], processes=1) as pool:
+            teller.catalog.add_product(self.APPLES, 2.99)
+            pool.refresh_prices()
+            receipt, = pool.checks_out_many(carts[3:4])
+
+        assert receipt.items[1].total_price == pytest.approx(2.99)
+
+    def test_refresh_prices_restarts_workers_for_new_offers(self, teller, carts):
+        with CheckoutPool(teller, [self.APPLES], processes=1) as pool:
+            teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.APPLES, 10.0)
+            teller.load_prices([self.TOOTHBRUSH, self.APPLES, self.TOOTHPASTE])
+            pool.refresh_prices()
+            receipts = pool.checks_out_many(carts)
+
+        for cart, receipt in zip(carts, receipts):
+            expected = teller.checks_out_articles_from(cart)
+            assert receipt.pricing_version == expected.pricing_version == teller.snapshot.version
+            assert receipt.total_price() == expected.total_price()
@@ -0,0 +1,45 @@
+import pytest
+from model_objects import Product, ProductUnit, SpecialOfferType, Offer
+from compiled_offers import compile_offer, compile_offers, offer_description
+
+
+class TestCompiledOffers:
+
+    @pytest.fixture
+    def sample_product(self):
+        return Product("toothbrush", ProductUnit.EACH)
+
+    @pytest.mark.parametrize("offer_type, argument, expected", [
+        (SpecialOfferType.THREE_FOR_TWO, None, "3 for 2"),
+        (SpecialOfferType.TEN_PERCENT_DISCOUNT, 10.0, "10.0% off"),
+        (SpecialOfferType.TWO_FOR_AMOUNT, 1.5, "2 for 1.5"),
+        (SpecialOfferType.FIVE_FOR_AMOUNT, 7.49, "5 for 7.49"),
+    ], ids=["3-for-2", "percent", "2-for-amount", "5-for-amount"])
+    def test_offer_description(self, sample_product, offer_type, argument, expected):
+        assert offer_description(Offer(offer_type, sample_product, argument)) == expected
+
+    @pytest.mark.parametrize("offer_type, argument, quantity, expected_amount", [
+        (SpecialOfferType.THREE_FOR_TWO, None, 3, -0.99),
+        (SpecialOfferType.THREE_FOR_TWO, None, 7, -1.98),
+        (SpecialOfferType.TEN_PERCENT_DISCOUNT, 10.0, 5, -0.495),
+        (SpecialOfferType.TWO_FOR_AMOUNT, 1.5, 2, -0.48),
+        (SpecialOfferType.FIVE_FOR_AMOUNT, 3.0, 10, -3.90),
+    ], ids=["3-for-2", "3-for-2-remainder", "percent", "2-for-amount", "5-for-amount"])
+    def test_compiled_offer_applies(self, sample_product, offer_type, argument, quantity, expected_amount):
+        discount = compile_offer(Offer(offer_type, sample_product, argument))(sample_product, quantity, 0.99)
+
+        assert discount.product == sample_product
+        assert discount.description == offer_description(Offer(offer_type, sample_product, argument))
+        assert discount.discount_amount == pytest.approx(expected_amount)
+
+    @pytest.mark.parametrize("offer_type, argument, quantity", [
+        (SpecialOfferType.THREE_FOR_TWO, None, 2),
+        (SpecialOfferType.TWO_FOR_AMOUNT, 1.5, 1),
+        (SpecialOfferType.FIVE_FOR_AMOUNT, 3.0, 4),
+    ], ids=["3-for-2", "2-for-amount", "5-for-amount"])
+    def test_compiled_offer_below_threshold(self, sample_product, offer_type, argument, quantity):
+        assert compile_offer(Offer(offer_type, sample_product, argument))(sample_product, quantity, 0.99) is None
+
+    def test_compile_offers_keeps_product_keys(self, sample_product):
+        offers = {sample_product: Offer(SpecialOfferType.THREE_FOR_TWO, sample_product, None)}
+        assert list(compile_offers(offers)) == [sample_product]
@@ -50,3 +50,5 @@ class TestDiscount:
         discount = Discount(sample_product, "Clearance", -9999.99)
         assert discount.discount_amount == -9999.99
 
+    def test_has_no_instance_dict(self, sample_product):
+        assert not hasattr(Discount(sample_product, "10% off", -0.099), "__dict__")
@@ -0,0 +1,125 @@
+import pytest
+from tests.fake_catalog import FakeCatalog
+from compiled_offers import compile_offer
+from model_objects import Product, ProductUnit, SpecialOfferType, Offer
+from fixed_point import (FixedPointReceiptPrinter, FixedPointTeller, compile_fixed_point_offer,
+                         round_div, to_cents, to_units)
+from receipt import Receipt
+from shopping_cart import ShoppingCart
+
+
+class TestFixedPoint:
+    TOOTHBRUSH = Product("toothbrush", ProductUnit.EACH)
+    APPLES = Product("apples", ProductUnit.KILO)
+    RICE = Product("rice", ProductUnit.EACH)
+
+    @pytest.fixture
+    def teller(self):
+        catalog = FakeCatalog()
+        catalog.add_product(self.TOOTHBRUSH, 0.99)
+        catalog.add_product(self.APPLES, 1.99)
+        catalog.add_product(self.RICE, 2.49)
+        return FixedPointTeller(catalog)
+
+    @pytest.mark.parametrize("numerator, denominator, expected", [
+        (2985, 1000, 3), (2500, 1000, 3), (2499, 1000, 2), (-2500, 1000, -3), (0, 7, 0),
+    ])
+    def test_round_div(self, numerator, denominator, expected):
+        assert round_div(numerator, denominator) == expected
+
+    def test_conversions(self):
+        assert to_cents(0.99) == 99
+        assert to_cents(1.005 * 1000) == 100500
+        assert to_units(self.APPLES, 0.1 + 0.2) == 300
+        assert to_units(self.TOOTHBRUSH, 3.0) == 3
+
+    @pytest.mark.parametrize("offer_type, argument, product, units, expected_cents", [
+        (SpecialOfferType.THREE_FOR_TWO, None, TOOTHBRUSH, 3, -99),
+        (SpecialOfferType.THREE_FOR_TWO, None, TOOTHBRUSH, 2, None),
+        (SpecialOfferType.TEN_PERCENT_DISCOUNT, 10.0, TOOTHBRUSH, 5, -50),
+        (SpecialOfferType.TEN_PERCENT_DISCOUNT, 20.0, APPLES, 1500, -30),
+        (SpecialOfferType.TWO_FOR_AMOUNT, 1.50, TOOTHBRUSH, 2, -48),
+        (SpecialOfferType.TWO_FOR_AMOUNT, 1.50, TOOTHBRUSH, 3, 27),
+        (SpecialOfferType.TWO_FOR_AMOUNT, 1.50, TOOTHBRUSH, 1, None),
+        (SpecialOfferType.FIVE_FOR_AMOUNT, 3.00, TOOTHBRUSH, 10, -390),
+        (SpecialOfferType.FIVE_FOR_AMOUNT, 3.00, TOOTHBRUSH, 4, None),
+    ])
+    def test_offers_in_cents(self, offer_type, argument, product, units, expected_cents):
+        discount = compile_fixed_point_offer(Offer(offer_type, product, argument))(product, units, 99)
+        if expected_cents is None:
+            assert discount is None
+        else:
+            assert discount.discount_amount == expected_cents
+
+    @pytest.mark.parametrize("offer_type, argument", [
+        (SpecialOfferType.THREE_FOR_TWO, None),
+        (SpecialOfferType.TEN_PERCENT_DISCOUNT, 10.0),
+        (SpecialOfferType.TWO_FOR_AMOUNT, 1.50),
+        (SpecialOfferType.FIVE_FOR_AMOUNT, 3.00),
+    ])
+    def test_offers_match_the_float_rules(self, offer_type, argument):
+        offer = Offer(offer_type, self.TOOTHBRUSH, argument)
+        in_cents = compile_fixed_point_offer(offer)
+        in_floats = compile_offer(offer)
+        for quantity in range(1, 12):
+            cents = in_cents(self.TOOTHBRUSH, quantity, 99)
+            floats = in_floats(self.TOOTHBRUSH, float(quantity), 0.99)
+            assert (cents is None) == (floats is None)
+            if cents is not None:
+                # Cents are rounded once, so they may differ by at most a cent.
+                assert cents.discount_amount / 100 == pytest.approx(floats.discount_amount, abs=0.01)
+
+    def test_pinned_prices_follow_snapshot_updates(self, teller):
+        cart = ShoppingCart()
+        cart.add_item(self.RICE)
+        teller.load_prices([self.RICE])
+        assert teller.checks_out_articles_from(cart).total_price() == 249
+
+        teller.update_prices({self.RICE: 1.25})
+
+        assert teller.checks_out_articles_from(cart).total_price() == 125
+
+    def test_checkout_is_exact(self, teller):
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+        teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.RICE, 10.0)
+        cart = ShoppingCart()
+        for _ in range(3):
+            cart.add_item(self.TOOTHBRUSH)
+        cart.add_item_quantity(self.APPLES, 0.1)
+        cart.add_item_quantity(self.APPLES, 0.2)
+        cart.add_item(self.RICE)
+
+        receipt = teller.checks_out_articles_from(cart)
+
+        assert [item.total_price for item in receipt.items] == [99, 99, 99, 20, 40, 249]
+        assert [d.discount_amount for d in receipt.discounts] == [-99, -25]
+        assert receipt.total_price() == 482
+
+    def test_printer_formats_cents_and_grams(self):
+        receipt = Receipt()
+        receipt.add_product(self.APPLES, 1500, 199, 299)
+        receipt.add_product(self.APPLES, 1000, 199, 199)
+        receipt.add_product(self.TOOTHBRUSH, 2, 99, 198)
+        ten_percent_off = compile_fixed_point_offer(Offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.APPLES, 10.0))
+        receipt.add_discount(ten_percent_off(self.APPLES, 2500, 199))
+
+        assert FixedPointReceiptPrinter().print_receipt(receipt) == (
+            "apples                              2.99\n"
+            "  1.99 * 1.500\n"
+            "apples                              1.99\n"
+            "toothbrush                          1.98\n"
+            "  0.99 * 2\n"
+            "10.0% off (apples)                 -0.50\n"
+            "\n"
+            "Total:                              6.46\n"
+        )
+
+    def test_printer_signs_a_voided_kilo_line(self, teller):
+        cart = ShoppingCart()
+        cart.add_item_quantity(self.APPLES, 0.5)
+        cart.void_item(self.APPLES, 0.25)
+
+        printed = FixedPointReceiptPrinter().print_receipt(teller.checks_out_articles_from(cart))
+
+        assert "  1.99 * -0.250\n" in printed
+        assert "Total:                              0.50\n" in printed
@@ -0,0 +1,140 @@
+import pytest
+from tests.fake_catalog import FakeCatalog
+from model_objects import Product, ProductUnit, SpecialOfferType, Discount
+from array_shopping_cart import ArrayShoppingCart
+from fixed_point import FixedPointTeller
+from incremental_receipt import IncrementalReceipt
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+
+class CountingCatalog(FakeCatalog):
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+
+    def unit_price(self, product):
+        self.lookups += 1
+        return super().unit_price(product)
+
+
+class TestIncrementalReceipt:
+    TOOTHBRUSH = Product("toothbrush", ProductUnit.EACH)
+    APPLES = Product("apples", ProductUnit.KILO)
+    RICE = Product("rice", ProductUnit.EACH)
+    TOOTHPASTE = Product("toothpaste", ProductUnit.EACH)
+
+    @pytest.fixture
+    def catalog(self):
+        catalog = CountingCatalog()
+        catalog.add_product(self.TOOTHBRUSH, 0.99)
+        catalog.add_product(self.APPLES, 1.99)
+        catalog.add_product(self.RICE, 2.49)
+        catalog.add_product(self.TOOTHPASTE, 1.79)
+        return catalog
+
+    @pytest.fixture
+    def teller(self, catalog):
+        teller = Teller(catalog)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+        teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.APPLES, 20.0)
+        teller.add_special_offer(SpecialOfferType.FIVE_FOR_AMOUNT, self.TOOTHPASTE, 7.49)
+        return teller
+
+    def assert_same_receipt(self, actual, expected):
+        assert [(i.product, i.quantity, i.price, i.total_price) for i in actual.items] == \
+               [(i.product, i.quantity, i.price, i.total_price) for i in expected.items]
+        assert [(d.product, d.description, d.discount_amount) for d in actual.discounts] == \
+               [(d.product, d.description, d.discount_amount) for d in expected.discounts]
+        assert actual.total_price() == pytest.approx(expected.total_price())
+
+    @pytest.mark.parametrize("cart_type", [ShoppingCart, ArrayShoppingCart])
+    def test_matches_full_checkout_after_every_scan(self, teller, cart_type):
+        scans = [self.TOOTHBRUSH, self.APPLES, self.RICE, self.TOOTHBRUSH, self.TOOTHPASTE,
+                 self.TOOTHBRUSH, self.TOOTHPASTE, self.TOOTHPASTE, self.TOOTHPASTE, self.TOOTHPASTE,
+                 self.APPLES, self.TOOTHBRUSH]
+        cart = cart_type()
+        receipt = None
+        for product in scans:
+            cart.add_item(product)
+            receipt = teller.checks_out_incrementally(cart, receipt)
+            self.assert_same_receipt(receipt, teller.checks_out_articles_from(cart))
+
+    def test_fixed_point_matches_full_checkout_after_every_scan(self, catalog):
+        teller = FixedPointTeller(catalog)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+        teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.APPLES, 20.0)
+        cart = ShoppingCart()
+        receipt = None
+        for product, quantity in [(self.TOOTHBRUSH, 1.0), (self.APPLES, 0.5), (self.TOOTHBRUSH, 2.0),
+                                  (self.APPLES, 2.0), (self.RICE, 1.0)]:
+            cart.add_item_quantity(product, quantity)
+            receipt = teller.checks_out_incrementally(cart, receipt)
+            self.assert_same_receipt(receipt, teller.checks_out_articles_from(cart))
+            assert receipt.total_price() == teller.checks_out_articles_from(cart).total_price()
+
+        assert [d.discount_amount for d in receipt.discounts] == [-99, -100]
+        assert receipt.total_price() == 99 * 3 - 99 + 498 - 100 + 249
+
+    def test_offers_published_later_apply_to_the_next_receipt(self, teller):
+        teller.load_prices([self.RICE])
+        cart = ShoppingCart()
+        cart.add_item(self.RICE)
+        receipt = teller.checks_out_incrementally(cart)
+        teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.RICE, 10.0)
+
+        cart.add_item(self.RICE)
+        teller.checks_out_incrementally(cart, receipt)
+
+        assert receipt.discounts == []
+        assert receipt.pricing_version == teller.snapshot.version - 1
+        assert [d.product for d in teller.checks_out_incrementally(cart).discounts] == [self.RICE]
+
+    def test_discount_is_inserted_in_first_scan_order(self, teller):
+        cart = ShoppingCart()
+        cart.add_item(self.TOOTHBRUSH)
+        cart.add_item(self.APPLES)
+        receipt = teller.checks_out_incrementally(cart)
+        assert [d.product for d in receipt.discounts] == [self.APPLES]
+
+        cart.add_item_quantity(self.TOOTHBRUSH, 2)
+        teller.checks_out_incrementally(cart, receipt)
+
+        assert [d.product for d in receipt.discounts] == [self.TOOTHBRUSH, self.APPLES]
+
+    def test_only_new_products_are_looked_up(self, teller, catalog):
+        cart = ShoppingCart()
+        cart.add_item(self.TOOTHBRUSH)
+        cart.add_item(self.RICE)
+        receipt = teller.checks_out_incrementally(cart)
+        catalog.lookups = 0
+
+        cart.add_item(self.TOOTHBRUSH)
+        cart.add_item(self.APPLES)
+        teller.checks_out_incrementally(cart, receipt)
+
+        assert catalog.lookups == 1
+        assert receipt.scans_priced == 4
+
+    def test_refresh_without_new_scans_changes_nothing(self, teller):
+        cart = ShoppingCart()
+        cart.add_item_quantity(self.TOOTHBRUSH, 3)
+        receipt = teller.checks_out_incrementally(cart)
+        total = receipt.total_price()
+
+        assert teller.checks_out_incrementally(cart, receipt) is receipt
+        assert len(receipt.items) == 1
+        assert len(receipt.discounts) == 1
+        assert receipt.total_price() == total
+
+    def test_removing_a_product_discount(self):
+        receipt = IncrementalReceipt()
+        receipt.add_product(self.TOOTHBRUSH, 3, 0.99, 2.97)
+        receipt.add_product(self.RICE, 1, 2.49, 2.49)
+        receipt.add_discount(Discount(self.TOOTHBRUSH, "3 for 2", -0.99))
+        receipt.add_discount(Discount(self.RICE, "10% off", -0.25))
+
+        receipt.set_product_discount(self.TOOTHBRUSH, None)
+
+        assert [d.product for d in receipt.discounts] == [self.RICE]
+        assert receipt.total_price() == pytest.approx(5.21)
@@ -0,0 +1,98 @@
+import threading
+
+import pytest
+from tests.fake_catalog import FakeCatalog
+from model_objects import Product, ProductUnit, SpecialOfferType, Offer
+from instrumentation import CheckoutStats, LatencyHistogram
+from receipt import Receipt
+from receipt_printer import ReceiptPrinter
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+
+class TestInstrumentation:
+    TOOTHBRUSH = Product("toothbrush", ProductUnit.EACH)
+    APPLES = Product("apples", ProductUnit.KILO)
+
+    @pytest.fixture
+    def catalog(self):
+        catalog = FakeCatalog()
+        catalog.add_product(self.TOOTHBRUSH, 0.99)
+        catalog.add_product(self.APPLES, 1.99)
+        return catalog
+
+    @pytest.fixture
+    def cart(self):
+        cart = ShoppingCart()
+        cart.add_item_quantity(self.TOOTHBRUSH, 3)
+        cart.add_item_quantity(self.APPLES, 1.5)
+        return cart
+
+    def test_histogram_buckets(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(seconds)
+
+        assert histogram.counts == [2, 1, 1]
+        assert list(histogram.cumulative_counts()) == [2, 3, 4]
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(2.65)
+
+    def test_checkout_records_phases_lookups_and_discounts(self, catalog, cart):
+        stats = CheckoutStats()
+        teller = Teller(catalog, stats)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+        teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.APPLES, 10.0)
+
+        ReceiptPrinter(stats=stats).print_receipt(teller.checks_out_articles_from(cart))
+
+        for phase in CheckoutStats.PHASES:
+            assert stats.phases[phase].count == 1
+        assert stats.catalog_requests == 1
+        assert stats.catalog_lookups == 2
+        assert stats.discounts_applied == {SpecialOfferType.THREE_FOR_TWO: 1,
+                                           SpecialOfferType.TEN_PERCENT_DISCOUNT: 1}
+
+    def test_handle_offers_records_lookups(self, catalog, cart):
+        stats = CheckoutStats()
+        offers = {self.APPLES: Offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.APPLES, 10.0)}
+
+        cart.handle_offers(Receipt(), offers, catalog, stats)
+
+        assert stats.catalog_lookups == 1
+        assert stats.phases["offer_evaluation"].count == 1
+        assert stats.discounts_applied == {SpecialOfferType.TEN_PERCENT_DISCOUNT: 1}
+
+    def test_prometheus_text_format(self, catalog, cart):
+        stats = CheckoutStats(buckets=(0.5,))
+        teller = Teller(catalog, stats)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+        teller.checks_out_articles_from(cart)
+
+        text = stats.to_prometheus()
+
+        assert "# TYPE supermarket_checkout_phase_seconds histogram\n" in text
+        assert 'supermarket_checkout_phase_seconds_bucket{phase="checkout",le="+Inf"} 1\n' in text
+        assert 'supermarket_checkout_phase_seconds_count{phase="rendering"} 0\n' in text
+        assert "supermarket_catalog_lookups_total 2\n" in text
+        assert 'supermarket_discounts_applied_total{offer_type="THREE_FOR_TWO"} 1\n' in text
+
+    def test_threads_record_into_shards_that_add_up(self, catalog, cart):
+        stats = CheckoutStats()
+        teller = Teller(catalog, stats)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+
+        def check_out():
+            for _ in range(50):
+                teller.checks_out_articles_from(cart)
+
+        threads = [threading.Thread(target=check_out) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(stats._shards) == 4
+        assert stats.phases["checkout"].count == 200
+        assert stats.catalog_requests == 200
+        assert stats.discounts_applied == {SpecialOfferType.THREE_FOR_TWO: 200}
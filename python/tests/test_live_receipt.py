@@ -0,0 +1,77 @@
+import pytest
+from tests.fake_catalog import FakeCatalog
+from model_objects import Product, ProductUnit, SpecialOfferType
+from array_shopping_cart import ArrayShoppingCart
+from live_receipt import LiveReceipt
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+
+class TestLiveReceipt:
+    TOOTHBRUSH = Product("toothbrush", ProductUnit.EACH)
+    APPLES = Product("apples", ProductUnit.KILO)
+    RICE = Product("rice", ProductUnit.EACH)
+
+    @pytest.fixture
+    def teller(self):
+        catalog = FakeCatalog()
+        catalog.add_product(self.TOOTHBRUSH, 0.99)
+        catalog.add_product(self.APPLES, 1.99)
+        catalog.add_product(self.RICE, 2.49)
+        teller = Teller(catalog)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+        teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.APPLES, 20.0)
+        return teller
+
+    @pytest.mark.parametrize("cart_type", [ShoppingCart, ArrayShoppingCart])
+    def test_follows_scans_and_voids(self, teller, cart_type):
+        cart = cart_type()
+        live = LiveReceipt(teller, cart)
+
+        cart.add_item_quantity(self.TOOTHBRUSH, 3)
+        assert live.total_price() == pytest.approx(1.98)
+        cart.add_item_quantity(self.APPLES, 0.5)
+        cart.add_item(self.RICE)
+        cart.void_item(self.TOOTHBRUSH)
+
+        expected = teller.checks_out_articles_from(cart)
+        assert len(live.items) == 4
+        assert [d.product for d in live.discounts] == [d.product for d in expected.discounts]
+        assert live.total_price() == pytest.approx(expected.total_price())
+
+    def test_voiding_below_the_offer_threshold_drops_the_discount(self, teller):
+        cart = ShoppingCart()
+        live = LiveReceipt(teller, cart)
+        cart.add_item_quantity(self.TOOTHBRUSH, 3)
+        assert len(live.discounts) == 1
+
+        cart.void_item(self.TOOTHBRUSH)
+
+        assert len(live.discounts) == 0
+        assert live.total_price() == pytest.approx(1.98)
+
+    def test_starts_from_items_already_in_the_cart(self, teller):
+        cart = ShoppingCart()
+        cart.add_item(self.RICE)
+        assert LiveReceipt(teller, cart).total_price() == 2.49
+
+    def test_notifies_on_change(self, teller):
+        cart = ShoppingCart()
+        totals = []
+        LiveReceipt(teller, cart, on_change=lambda live: totals.append(live.total_price()))
+
+        cart.add_item(self.RICE)
+        cart.add_item(self.RICE)
+
+        assert totals == [2.49, 4.98]
+
+    def test_finish_stops_observing(self, teller):
+        cart = ShoppingCart()
+        live = LiveReceipt(teller, cart)
+        cart.add_item(self.RICE)
+
+        receipt = live.finish()
+        cart.add_item(self.RICE)
+
+        assert len(receipt.items) == 1
+        assert receipt.total_price() == 2.49
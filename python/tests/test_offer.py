@@ -50,3 +50,8 @@ class TestOffer:
                 product=None,
                 argument=10
             )
+
+
+    def test_has_no_instance_dict(self, sample_product):
+        offer = Offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, sample_product, 10.0)
+        assert not hasattr(offer, "__dict__")
@@ -0,0 +1,127 @@
+import pytest
+from tests.fake_catalog import FakeCatalog
+from caching_catalog import CachingCatalog
+from model_objects import Product, ProductUnit, SpecialOfferType
+from pricing_snapshot import PricingSnapshot
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+
+class TestPricingSnapshot:
+    TOOTHBRUSH = Product("toothbrush", ProductUnit.EACH)
+    APPLES = Product("apples", ProductUnit.KILO)
+
+    @pytest.fixture
+    def catalog(self):
+        catalog = FakeCatalog()
+        catalog.add_product(self.TOOTHBRUSH, 0.99)
+        catalog.add_product(self.APPLES, 1.99)
+        return catalog
+
+    @pytest.fixture
+    def cart(self):
+        cart = ShoppingCart()
+        cart.add_item_quantity(self.TOOTHBRUSH, 3)
+        cart.add_item_quantity(self.APPLES, 1.0)
+        return cart
+
+    def test_snapshot_cannot_be_changed_in_place(self, catalog):
+        snapshot = PricingSnapshot(catalog)
+        with pytest.raises(TypeError):
+            snapshot.prices[self.APPLES] = 1.0
+        with pytest.raises(TypeError):
+            snapshot.offers[self.APPLES] = None
+
+    def test_changes_build_new_versions(self, catalog):
+        teller = Teller(catalog)
+        first = teller.snapshot
+
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+        teller.update_prices({self.APPLES: 1.49})
+
+        assert first.version == 0
+        assert first.offers == {}
+        assert teller.snapshot.version == 2
+        assert self.TOOTHBRUSH in teller.offers
+        assert teller.snapshot.prices == {self.APPLES: 1.49}
+
+    def test_receipt_records_the_version_that_priced_it(self, catalog, cart):
+        teller = Teller(catalog)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+        teller.load_prices([self.TOOTHBRUSH, self.APPLES])
+
+        assert teller.checks_out_articles_from(cart).pricing_version == 2
+        assert teller.checks_out_many([cart])[0].pricing_version == 2
+        assert teller.checks_out_incrementally(cart).pricing_version == 2
+
+    def test_receipt_priced_from_the_catalog_records_no_version(self, catalog, cart):
+        teller = Teller(catalog)
+        teller.update_prices({self.TOOTHBRUSH: 0.99})
+
+        assert teller.checks_out_articles_from(cart).pricing_version is None
+        assert teller.checks_out_many([cart])[0].pricing_version is None
+        assert teller.checks_out_incrementally(cart).pricing_version is None
+
+    def test_snapshot_prices_are_used_before_the_catalog(self, catalog, cart):
+        teller = Teller(catalog)
+        teller.update_prices({self.APPLES: 1.49})
+        catalog.add_product(self.APPLES, 5.00)
+
+        receipt = teller.checks_out_articles_from(cart)
+
+        assert receipt.total_price() == pytest.approx(3 * 0.99 + 1.49)
+
+    def test_load_prices_pins_catalog_prices(self, catalog, cart):
+        teller = Teller(catalog)
+        teller.load_prices([self.TOOTHBRUSH, self.APPLES])
+        catalog.add_product(self.APPLES, 5.00)
+
+        assert teller.checks_out_articles_from(cart).total_price() == pytest.approx(3 * 0.99 + 1.99)
+
+    def test_offer_added_during_checkout_applies_to_the_next_one(self, catalog, cart):
+        teller = Teller(catalog)
+        unit_prices = catalog.unit_prices
+
+        def add_offer_while_pricing(products):
+            teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.TOOTHBRUSH, None)
+            return unit_prices(products)
+
+        catalog.unit_prices = add_offer_while_pricing
+        receipt = teller.checks_out_articles_from(cart)
+        catalog.unit_prices = unit_prices
+
+        assert teller.snapshot.version == 1
+        assert receipt.discounts == []
+        assert len(teller.checks_out_articles_from(cart).discounts) == 1
+
+    def test_catalog_changes_reach_the_next_checkout(self, catalog, cart):
+        teller = Teller(catalog)
+        first = teller.checks_out_articles_from(cart)
+        catalog.add_product(self.APPLES, 5.00)
+        second = teller.checks_out_articles_from(cart)
+
+        assert first.total_price() == pytest.approx(3 * 0.99 + 1.99)
+        assert second.total_price() == pytest.approx(3 * 0.99 + 5.00)
+
+    def test_invalidated_catalog_prices_reach_the_next_checkout(self, catalog, cart):
+        caching = CachingCatalog(catalog)
+        teller = Teller(caching)
+        teller.checks_out_articles_from(cart)
+        catalog.add_product(self.APPLES, 5.00)
+        caching.invalidate(self.APPLES)
+
+        assert teller.checks_out_articles_from(cart).total_price() == pytest.approx(3 * 0.99 + 5.00)
+
+    def test_incremental_receipt_keeps_its_first_version(self, catalog):
+        teller = Teller(catalog)
+        teller.load_prices([self.TOOTHBRUSH, self.APPLES])
+        cart = ShoppingCart()
+        cart.add_item(self.TOOTHBRUSH)
+        receipt = teller.checks_out_incrementally(cart)
+        teller.update_prices({self.APPLES: 1.49})
+
+        cart.add_item(self.APPLES)
+        teller.checks_out_incrementally(cart, receipt)
+
+        assert receipt.pricing_version == 1
+        assert receipt.items[1].price == 1.99
@@ -36,4 +36,11 @@ class TestProduct:
     ])
     def test_invalid_creation(self, name, unit, expected_error, error_pattern):
         with pytest.raises(expected_error, match=error_pattern):
-            Product(name, unit)
\ No newline at end of file
+            Product(name, unit)
+
+
+    def test_has_no_instance_dict(self):
+        product = Product("toothbrush", ProductUnit.EACH)
+        assert not hasattr(product, "__dict__")
+        with pytest.raises(AttributeError):
+            product.price = 0.99
@@ -46,8 +46,5 @@ class TestProductQuantity:
         with pytest.raises(expected_error, match=error_pattern):
             ProductQuantity(product, quantity)
 
-
-    
-
-
-    
+    def test_has_no_instance_dict(self, unit_product):
+        assert not hasattr(ProductQuantity(unit_product, 1), "__dict__")
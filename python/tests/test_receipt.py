@@ -114,3 +114,24 @@ class TestReceipt:
         assert len(receipt.discounts) == 2
         
 
+    def test_items_and_discounts_are_read_only_views(self, receipt, sample_product):
+        items = receipt.items
+        discounts = receipt.discounts
+        receipt.add_product(sample_product, 3, 0.99, 2.97)
+        receipt.add_discount(Discount(sample_product, "3 for 2", -0.99))
+
+        assert receipt.items is items
+        assert len(items) == 1
+        assert items[0].total_price == 2.97
+        assert discounts == [receipt.discounts[0]]
+        assert not hasattr(items, "append")
+
+    def test_total_price_is_kept_up_to_date(self, receipt, sample_product):
+        receipt.add_product(sample_product, 1, 0.99, 0.99)
+        assert receipt.total_price() == 0.99
+        receipt.add_discount(Discount(sample_product, "Sale", -0.10))
+        assert receipt.total_price() == pytest.approx(0.89)
+        receipt.add_product(sample_product, 2, 0.99, 1.98)
+        assert receipt.total_price() == pytest.approx(2.87)
+        receipt.add_discount(Discount(sample_product, "Bulk", -0.50))
+        assert receipt.total_price() == pytest.approx(2.37)
@@ -71,7 +71,5 @@ class TestReceiptItem:
         with pytest.raises(TypeError, match=r"product cannot be None"):
             ReceiptItem(None, 1, 1.0, 1.0)
 
-
-
-
-    
\ No newline at end of file
+    def test_has_no_instance_dict(self, sample_product):
+        assert not hasattr(ReceiptItem(sample_product, 1, 0.99, 0.99), "__dict__")
@@ -1,3 +1,4 @@
+import io
 import pytest
 from model_objects import Product, ProductUnit , Discount
 from receipt import ReceiptItem , Receipt
@@ -73,3 +74,34 @@ class TestReceiptPrinter:
 
 
 
+    # ---- Test Streaming Output ----
+
+    @pytest.fixture
+    def receipt(self, sample_item):
+        receipt = Receipt()
+        receipt.add_product(sample_item.product, 2, 0.99, 1.98)
+        receipt.add_discount(Discount(sample_item.product, "10% off", -0.198))
+        return receipt
+
+    def test_iter_lines_yields_one_line_at_a_time(self, receipt):
+        lines = list(ReceiptPrinter().iter_lines(receipt))
+
+        assert all(line.count("\n") == 1 for line in lines)
+        assert "".join(lines) == ReceiptPrinter().print_receipt(receipt)
+
+    def test_write_receipt_to_text_stream(self, receipt):
+        stream = io.StringIO()
+        ReceiptPrinter().write_receipt(receipt, stream)
+        assert stream.getvalue() == ReceiptPrinter().print_receipt(receipt)
+
+    def test_write_receipt_to_bytes_stream(self, receipt):
+        stream = io.BytesIO()
+        ReceiptPrinter().write_receipt(receipt, stream)
+        assert stream.getvalue() == ReceiptPrinter().print_receipt(receipt).encode()
+
+    def test_print_many_separates_receipts(self, receipt):
+        stream = io.StringIO()
+        ReceiptPrinter().print_many([receipt, Receipt()], stream)
+
+        expected = ReceiptPrinter().print_receipt(receipt) + "\n" + ReceiptPrinter().print_receipt(Receipt()) + "\n"
+        assert stream.getvalue() == expected
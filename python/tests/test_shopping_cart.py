@@ -62,6 +62,22 @@ class TestShoppingCart:
         assert len(cart.items) == 2
         assert cart.product_quantities[sample_product] == 2
 
+    def test_void_item(self, cart, sample_product):
+        cart.add_item_quantity(sample_product, 2.0)
+        cart.void_item(sample_product)
+        assert cart.product_quantities[sample_product] == 1.0
+        assert cart.items[-1].quantity == -1.0
+        with pytest.raises(ValueError):
+            cart.void_item(sample_product, 2.0)
+
+    @pytest.mark.parametrize("quantity", [0, -1.0])
+    def test_void_item_rejects_non_positive_quantities(self, cart, sample_product, quantity):
+        cart.add_item_quantity(sample_product, 2.0)
+        with pytest.raises(ValueError, match=r"quantity must be positive"):
+            cart.void_item(sample_product, quantity)
+        assert len(cart.items) == 1
+
+
     @pytest.mark.parametrize("product, quantity, expected_error, error_pattern", [
     # Invalid products
     (None, 1, ValueError, r"product cannot be None"),
@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+from model_objects import Product, ProductUnit, SpecialOfferType
+from shopping_cart import ShoppingCart
+from sqlite_catalog import SqliteCatalog
+from teller import Teller
+
+
+class TestSqliteCatalog:
+    TOOTHBRUSH = Product("toothbrush", ProductUnit.EACH)
+    APPLES = Product("apples", ProductUnit.KILO)
+
+    @pytest.fixture
+    def catalog(self):
+        catalog = SqliteCatalog()
+        catalog.add_product(self.TOOTHBRUSH, 0.99)
+        catalog.add_product(self.APPLES, 1.99)
+        yield catalog
+        catalog.close()
+
+    def test_unit_price(self, catalog):
+        assert catalog.unit_price(self.TOOTHBRUSH) == 0.99
+        assert catalog.unit_price(self.APPLES) == 1.99
+
+    def test_unknown_product_raises_key_error(self, catalog):
+        with pytest.raises(KeyError):
+            catalog.unit_price(Product("rice", ProductUnit.EACH))
+
+    def test_add_product_replaces_price(self, catalog):
+        catalog.add_product(self.TOOTHBRUSH, 1.25)
+        assert catalog.unit_price(self.TOOTHBRUSH) == 1.25
+
+    def test_unit_prices_in_one_query(self, catalog):
+        products = [Product(f"product {i}", ProductUnit.EACH) for i in range(2000)]
+        catalog.add_products((product, i / 100) for i, product in enumerate(products))
+
+        prices = catalog.unit_prices(products + [self.APPLES, self.APPLES])
+
+        assert len(prices) == 2001
+        assert prices[products[1234]] == 12.34
+        assert prices[self.APPLES] == 1.99
+
+    def test_product_with_name(self, catalog):
+        apples = catalog.product_with_name("apples")
+        assert apples.name == "apples"
+        assert apples.unit == ProductUnit.KILO
+        assert catalog.product_with_name("rice") is None
+
+    def test_product_with_name_returns_the_same_product(self, catalog, tmp_path):
+        assert catalog.product_with_name("apples") is self.APPLES
+
+        path = str(tmp_path / "catalog.db")
+        writer = SqliteCatalog(path)
+        writer.add_product(self.APPLES, 1.99)
+        writer.close()
+        reopened = SqliteCatalog(path)
+        assert reopened.product_with_name("apples") is reopened.product_with_name("apples")
+        reopened.close()
+
+    def test_separate_catalogs_do_not_share_memory_databases(self, catalog):
+        other = SqliteCatalog()
+        assert other.product_with_name("apples") is None
+        other.close()
+
+    def test_file_database_survives_reopening(self, tmp_path):
+        path = str(tmp_path / "catalog.db")
+        catalog = SqliteCatalog(path)
+        catalog.add_product(self.APPLES, 1.99)
+        catalog.close()
+
+        reopened = SqliteCatalog(path)
+        assert reopened.unit_price(self.APPLES) == 1.99
+        reopened.close()
+
+    def test_concurrent_lookups_share_the_pool(self, catalog):
+        errors = []
+
+        def look_up():
+            try:
+                for _ in range(200):
+                    assert catalog.unit_price(self.APPLES) == 1.99
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=look_up) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert catalog._opened <= catalog.pool_size
+
+    def test_teller_finds_products_by_name(self, catalog):
+        teller = Teller(catalog)
+        cart = ShoppingCart()
+        cart.add_item_quantity(teller.product_with_name("apples"), 2.0)
+
+        receipt = teller.checks_out_articles_from(cart)
+
+        assert receipt.total_price() == pytest.approx(3.98)
+
+    def test_offer_applies_to_products_found_by_name(self, catalog):
+        teller = Teller(catalog)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, teller.product_with_name("toothbrush"), None)
+        cart = ShoppingCart()
+        for _ in range(3):
+            cart.add_item(teller.product_with_name("toothbrush"))
+
+        receipt = teller.checks_out_articles_from(cart)
+
+        assert len(receipt.items) == 3
+        assert receipt.total_price() == pytest.approx(1.98)
@@ -48,6 +48,7 @@ class TestTeller:
         assert stored_offer.offer_type == offer_type
         assert stored_offer.argument == argument
         assert stored_offer.product == self.TOOTHBRUSH
+        assert self.TOOTHBRUSH in teller.discount_functions
     
     def test_checkout_with_empty_cart_creates_empty_receipt(self, teller, cart):
         receipt = teller.checks_out_articles_from(cart)
@@ -69,3 +70,30 @@ class TestTeller:
         assert receipt.items[1].quantity == 1.5
         assert receipt.items[1].total_price == pytest.approx(2.985)
     
+
+    def test_checks_out_many_returns_receipt_per_cart(self, teller, cart):
+        cart.add_item_quantity(self.TOOTHBRUSH, 2)
+        other = ShoppingCart()
+        other.add_item_quantity(self.APPLES, 1.5)
+
+        receipts = teller.checks_out_many([cart, other])
+
+        assert len(receipts) == 2
+        assert receipts[0].items[0].product == self.TOOTHBRUSH
+        assert receipts[0].total_price() == pytest.approx(1.98)
+        assert receipts[1].items[0].product == self.APPLES
+        assert receipts[1].total_price() == pytest.approx(2.985)
+
+    def test_checkout_fetches_prices_in_one_call(self, teller, cart):
+        calls = []
+        unit_prices = teller.catalog.unit_prices
+        teller.catalog.unit_prices = lambda products: calls.append(list(products)) or unit_prices(products)
+        teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.TOOTHBRUSH, 10.0)
+        cart.add_item(self.TOOTHBRUSH)
+        cart.add_item_quantity(self.APPLES, 1.5)
+        cart.add_item(self.TOOTHBRUSH)
+
+        receipt = teller.checks_out_articles_from(cart)
+
+        assert calls == [[self.TOOTHBRUSH, self.APPLES]]
+        assert len(receipt.discounts) == 1
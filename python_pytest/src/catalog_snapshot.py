@@ -0,0 +1,146 @@
+"""
+Binary catalog snapshot, written once from catalog.csv and opened with mmap.
+
+Create a snapshot from a command prompt in the same folder as this file with:
+
+python catalog_snapshot.py catalog.csv catalog.snapshot
+
+Layout (little-endian):
+    header      magic, version, product count, name width
+    names       count * name width bytes, utf-8, zero padded
+    units       count bytes, ProductUnit values
+    prices      count * float64
+    name index  count * uint32 row numbers, sorted by encoded name
+"""
+
+import csv
+import mmap
+import struct
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+
+from catalog import SupermarketCatalog
+from model_objects import Product, ProductUnit
+
+MAGIC = b"SRCS"
+VERSION = 1
+HEADER = struct.Struct("<4sIII")
+PRICE = struct.Struct("<d")
+ROW = struct.Struct("<I")
+
+
+def write_snapshot(catalog_file, snapshot_file):
+    names = []
+    units = bytearray()
+    prices = []
+    with open(catalog_file, "r") as f:
+        for row in csv.DictReader(f):
+            names.append(row['name'].encode())
+            units.append(ProductUnit[row['unit']].value)
+            prices.append(float(row['price']))
+
+    count = len(names)
+    name_width = max((len(name) for name in names), default=0)
+    index = sorted(range(count), key=names.__getitem__)
+    with open(snapshot_file, "wb") as out:
+        out.write(HEADER.pack(MAGIC, VERSION, count, name_width))
+        out.write(b"".join(name.ljust(name_width, b"\0") for name in names))
+        out.write(units)
+        out.write(struct.pack(f"<{count}d", *prices))
+        out.write(struct.pack(f"<{count}I", *index))
+
+
+class SnapshotProducts(Mapping):
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+
+    def __getitem__(self, name):
+        return self._snapshot.product(name)
+
+    def __len__(self):
+        return self._snapshot.count
+
+    def __iter__(self):
+        for position in range(self._snapshot.count):
+            yield self._snapshot.name(self._snapshot.row_at(position))
+
+
+class SnapshotCatalog(SupermarketCatalog):
+
+    def __init__(self, snapshot_file):
+        with open(snapshot_file, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            self._map.close()
+            raise ValueError(f"{snapshot_file} is not a version {VERSION} catalog snapshot")
+        magic, version, self.count, self._name_width = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{snapshot_file} is not a version {VERSION} catalog snapshot")
+        self._names_offset = HEADER.size
+        self._units_offset = self._names_offset + self.count * self._name_width
+        self._prices_offset = self._units_offset + self.count
+        self._index_offset = self._prices_offset + self.count * PRICE.size
+        if len(self._map) < self._index_offset + self.count * ROW.size:
+            self._map.close()
+            raise ValueError(f"{snapshot_file} is truncated")
+        self._rows = {}
+        self._products = {}
+        self.products = SnapshotProducts(self)
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add_product(self, product, price):
+        raise Exception("cannot add products to a catalog snapshot - rebuild it from the csv")
+
+    def unit_price(self, product):
+        return PRICE.unpack_from(self._map, self._prices_offset + self._row(product.name) * PRICE.size)[0]
+
+    def product(self, name):
+        product = self._products.get(name)
+        if product is None:
+            row = self._row(name)
+            unit = ProductUnit(self._map[self._units_offset + row])
+            product = self._products[name] = Product(name, unit)
+        return product
+
+    def name(self, row):
+        start = self._names_offset + row * self._name_width
+        return self._map[start:start + self._name_width].rstrip(b"\0").decode()
+
+    def row_at(self, position):
+        return ROW.unpack_from(self._map, self._index_offset + position * ROW.size)[0]
+
+    def _row(self, name):
+        row = self._rows.get(name)
+        if row is None:
+            row = self._rows[name] = self._find_row(name)
+        return row
+
+    def _find_row(self, name):
+        key = name.encode()
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            row = self.row_at(middle)
+            start = self._names_offset + row * self._name_width
+            candidate = self._map[start:start + self._name_width].rstrip(b"\0")
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return row
+        raise KeyError(name)
+
+
+if __name__ == "__main__":
+    write_snapshot(Path(sys.argv[1]), Path(sys.argv[2]))
@@ -2,11 +2,22 @@
 Start texttest from a command prompt in the same folder as this file with this command:
 
 texttest -a sr -d .
+
+To replay a file of many baskets (a cart.csv with an extra basket_id column,
+rows of one basket kept together) and stream every receipt to a file:
+
+python texttest_fixture.py baskets.csv receipts.txt
+
+A catalog.snapshot next to catalog.csv (see catalog_snapshot.py) is used
+instead of parsing the csv when it exists; it is rebuilt first whenever
+catalog.csv is newer.
 """
 
 import sys,csv
+from itertools import groupby
 from pathlib import Path
 
+from catalog_snapshot import SnapshotCatalog, write_snapshot
 from model_objects import Product, SpecialOfferType, ProductUnit
 from receipt_printer import ReceiptPrinter
 from shopping_cart import ShoppingCart
@@ -42,24 +53,69 @@ def read_offers(offers_file, teller):
             teller.add_special_offer(offerType, product, argument)
 
 
+def fill_cart(cart, rows, catalog):
+    for row in rows:
+        name = row['name']
+        quantity = float(row['quantity'])
+        product = catalog.products[name]
+        cart.add_item_quantity(product, quantity)
+    return cart
+
+
 def read_basket(cart_file, catalog):
     cart = ShoppingCart()
     if not cart_file.exists():
         return cart
     with open(cart_file, "r") as f:
+        return fill_cart(cart, csv.DictReader(f), catalog)
+
+
+def read_baskets(baskets_file, catalog):
+    if not baskets_file.exists():
+        return
+    with open(baskets_file, "r") as f:
         reader = csv.DictReader(f)
-        for row in reader:
-            name = row['name']
-            quantity = float(row['quantity'])
-            product = catalog.products[name]
-            cart.add_item_quantity(product, quantity)
-    return cart
+        for basket_id, rows in groupby(reader, key=lambda row: row['basket_id']):
+            yield basket_id, fill_cart(ShoppingCart(), rows, catalog)
+
+
+def print_receipts(baskets, teller, out):
+    printer = ReceiptPrinter()
+    for basket_id, basket in baskets:
+        receipt = teller.checks_out_articles_from(basket)
+        out.write(f"Basket: {basket_id}\n")
+        out.write(printer.print_receipt(receipt))
+        out.write("\n")
+
+
+def open_catalog(catalog_file, snapshot_file):
+    if not snapshot_file.exists():
+        return read_catalog(catalog_file)
+    if catalog_file.exists() and catalog_file.stat().st_mtime > snapshot_file.stat().st_mtime:
+        write_snapshot(catalog_file, snapshot_file)
+    return SnapshotCatalog(snapshot_file)
 
 
 def main(args):
-    catalog = read_catalog(Path("catalog.csv"))
+    catalog = open_catalog(Path("catalog.csv"), Path("catalog.snapshot"))
+    try:
+        check_out(args, catalog)
+    finally:
+        if isinstance(catalog, SnapshotCatalog):
+            catalog.close()
+
+
+def check_out(args, catalog):
     teller = Teller(catalog)
     read_offers(Path("offers.csv"), teller)
+    if args:
+        baskets = read_baskets(Path(args[0]), catalog)
+        if len(args) > 1:
+            with open(args[1], "w") as out:
+                print_receipts(baskets, teller, out)
+        else:
+            print_receipts(baskets, teller, sys.stdout)
+        return
     basket = read_basket(Path("cart.csv"), catalog)
     receipt = teller.checks_out_articles_from(basket)
     print(ReceiptPrinter().print_receipt(receipt))
@@ -0,0 +1,57 @@
+import pytest
+
+from catalog_snapshot import SnapshotCatalog, write_snapshot
+from model_objects import ProductUnit
+from teller import Teller
+
+
+@pytest.fixture
+def snapshot_file(tmp_path):
+    catalog_file = tmp_path / "catalog.csv"
+    catalog_file.write_text(
+        "name,unit,price\n"
+        "toothbrush,EACH,0.99\n"
+        "apples,KILO,1.99\n"
+        "rice,EACH,2.49\n"
+        "cherry tomatoes,EACH,0.69\n"
+    )
+    snapshot_file = tmp_path / "catalog.snapshot"
+    write_snapshot(catalog_file, snapshot_file)
+    return snapshot_file
+
+
+def test_products_are_materialized_once(snapshot_file):
+    with SnapshotCatalog(snapshot_file) as catalog:
+        apples = catalog.products["apples"]
+        assert apples.name == "apples"
+        assert apples.unit == ProductUnit.KILO
+        assert catalog.products["apples"] is apples
+
+
+def test_unit_price(snapshot_file):
+    with SnapshotCatalog(snapshot_file) as catalog:
+        assert catalog.unit_price(catalog.products["toothbrush"]) == 0.99
+        assert catalog.unit_price(catalog.products["cherry tomatoes"]) == 0.69
+
+
+def test_unknown_product(snapshot_file):
+    with SnapshotCatalog(snapshot_file) as catalog:
+        assert len(catalog.products) == 4
+        assert sorted(catalog.products) == ["apples", "cherry tomatoes", "rice", "toothbrush"]
+        assert Teller(catalog).product_with_name("milk") is None
+        with pytest.raises(KeyError):
+            catalog.products["milk"]
+
+
+def test_rejects_other_files(tmp_path):
+    not_a_snapshot = tmp_path / "catalog.csv"
+    not_a_snapshot.write_text("name,unit,price\n")
+    with pytest.raises(ValueError, match="not a version 1 catalog snapshot"):
+        SnapshotCatalog(not_a_snapshot)
+
+
+@pytest.mark.parametrize("length", [0, 8, 40])
+def test_truncated_snapshot_is_rejected(snapshot_file, length):
+    snapshot_file.write_bytes(snapshot_file.read_bytes()[:length])
+    with pytest.raises(ValueError):
+        SnapshotCatalog(snapshot_file)
@@ -0,0 +1,94 @@
+import importlib
+import os
+import io
+from pathlib import Path
+
+import pytest
+
+from model_objects import Product, ProductUnit, SpecialOfferType
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+@pytest.fixture
+def fixture_module(monkeypatch):
+    # texttest runs the fixture with the receipt printer importable at top level.
+    monkeypatch.syspath_prepend(str(Path(__file__).parent))
+    return importlib.import_module("texttest_fixture")
+
+
+@pytest.fixture
+def catalog():
+    catalog = FakeCatalog()
+    catalog.add_product(Product("toothbrush", ProductUnit.EACH), 0.99)
+    catalog.add_product(Product("apples", ProductUnit.KILO), 1.99)
+    return catalog
+
+
+@pytest.fixture
+def baskets_file(tmp_path):
+    baskets_file = tmp_path / "baskets.csv"
+    baskets_file.write_text(
+        "basket_id,name,quantity\n"
+        "a,toothbrush,1\n"
+        "a,apples,2.5\n"
+        "b,toothbrush,3\n"
+        "c,apples,1\n"
+        "c,toothbrush,1\n"
+        "c,apples,1\n"
+    )
+    return baskets_file
+
+
+def test_read_baskets_groups_consecutive_rows(fixture_module, catalog, baskets_file):
+    baskets = list(fixture_module.read_baskets(baskets_file, catalog))
+
+    assert [basket_id for basket_id, _ in baskets] == ["a", "b", "c"]
+    assert [len(cart.items) for _, cart in baskets] == [2, 1, 3]
+    apples = catalog.products["apples"]
+    assert baskets[2][1].product_quantities[apples] == 2.0
+
+
+def test_read_baskets_of_missing_file(fixture_module, catalog, tmp_path):
+    assert list(fixture_module.read_baskets(tmp_path / "missing.csv", catalog)) == []
+
+
+def test_print_receipts_streams_one_receipt_per_basket(fixture_module, catalog, baskets_file):
+    teller = Teller(catalog)
+    teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, catalog.products["toothbrush"], 0.0)
+    out = io.StringIO()
+
+    fixture_module.print_receipts(fixture_module.read_baskets(baskets_file, catalog), teller, out)
+
+    text = out.getvalue()
+    assert [line for line in text.splitlines() if line.startswith("Basket: ")] == \
+           ["Basket: a", "Basket: b", "Basket: c"]
+    basket_b = text[text.index("Basket: b"):text.index("Basket: c")]
+    assert "3 for 2 (toothbrush)" in basket_b
+    assert basket_b.rstrip().endswith("1.98")
+    assert text.count("Total:") == 3
+
+
+def test_open_catalog_rebuilds_a_stale_snapshot(fixture_module, tmp_path):
+    catalog_file = tmp_path / "catalog.csv"
+    snapshot_file = tmp_path / "catalog.snapshot"
+    catalog_file.write_text("name,unit,price\napples,KILO,1.99\n")
+    fixture_module.write_snapshot(catalog_file, snapshot_file)
+    catalog_file.write_text("name,unit,price\napples,KILO,2.49\n")
+    snapshot_mtime = snapshot_file.stat().st_mtime
+    os.utime(catalog_file, (snapshot_mtime + 10, snapshot_mtime + 10))
+
+    catalog = fixture_module.open_catalog(catalog_file, snapshot_file)
+    try:
+        assert catalog.unit_price(catalog.products["apples"]) == 2.49
+    finally:
+        catalog.close()
+
+
+def test_open_catalog_without_snapshot_reads_the_csv(fixture_module, tmp_path):
+    catalog_file = tmp_path / "catalog.csv"
+    catalog_file.write_text("name,unit,price\napples,KILO,1.99\n")
+
+    catalog = fixture_module.open_catalog(catalog_file, tmp_path / "catalog.snapshot")
+
+    assert catalog.unit_price(catalog.products["apples"]) == 1.99
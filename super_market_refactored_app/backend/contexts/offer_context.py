@@ -1,11 +1,28 @@
+from functools import lru_cache
+
+from backend.registries.strategy_registry import strategy_registry
+
+
 class OfferContext:
-    def __init__(self):
-        self.strategies = {
-            OfferType.THREE_FOR_TWO: ThreeForTwoStrategy(),
-            OfferType.TEN_PERCENT: TenPercentStrategy(),
-            OfferType.FIVE_FOR_AMOUNT: BulkDiscountStrategy()
-        }
-    
-    def calculate_discount(self, offer_type, product, quantity,minimum_quantity_apply ,argument=None):
-        strategy = self.strategies.get(offer_type)
-        return strategy.calculate_discount(product, quantity, argument)
+    def __init__(self, registry=None, memo_size=4096):
+        self.registry = registry or strategy_registry
+        # Keyed on the strategy instance, so registering a replacement
+        # strategy never serves results computed by the old one.
+        self._memo = lru_cache(maxsize=memo_size)(self._calculate)
+
+    def calculate_discount(self, offer_type, unit_price, quantity, minimum_quantity_apply, argument=None):
+        strategy = self.registry.get(offer_type)
+        return self._memo(strategy, unit_price, quantity, minimum_quantity_apply, argument)
+
+    def memo_info(self):
+        return self._memo.cache_info()
+
+    def clear_memo(self):
+        self._memo.cache_clear()
+
+    @staticmethod
+    def _calculate(strategy, unit_price, quantity, minimum_quantity_apply, argument):
+        return strategy.calculate_discount(unit_price, quantity, minimum_quantity_apply, argument)
+
+
+offer_context = OfferContext()
@@ -1,10 +1,14 @@
+from backend.serializers.receipt_encoder import ReceiptJsonEncoder
+
+
 class CheckoutController:
-    def __init__(self, cart_service, receipt_service):
+    def __init__(self, cart_service, receipt_service, encoder=None):
         self.cart_service = cart_service
         self.receipt_service = receipt_service
+        self.encoder = encoder or ReceiptJsonEncoder()
     
     def checkout(self, cart_id):
         cart = self.cart_service.get_cart(cart_id)
         item_discounts = self.cart_service.get_discounts(cart)  # Move logic here
         receipt = self.receipt_service.generate(cart, item_discounts)
-        return Response(receipt.to_dict())
\ No newline at end of file
+        return Response(self.encoder.encode(receipt), content_type=self.encoder.content_type)
@@ -0,0 +1,98 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS product (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    price REAL NOT NULL,
+    unit TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS offer (
+    id INTEGER PRIMARY KEY,
+    type TEXT NOT NULL,
+    argument REAL,
+    is_active INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS product_offer (
+    product_id INTEGER NOT NULL REFERENCES product (id),
+    offer_id INTEGER NOT NULL REFERENCES offer (id),
+    min_quantity REAL NOT NULL,
+    PRIMARY KEY (product_id, offer_id)
+);
+CREATE TABLE IF NOT EXISTS cart (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cart_item (
+    id INTEGER PRIMARY KEY,
+    cart_id INTEGER NOT NULL REFERENCES cart (id),
+    product_id INTEGER NOT NULL REFERENCES product (id),
+    quantity REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cart_item_cart_id ON cart_item (cart_id);
+CREATE TABLE IF NOT EXISTS receipt (
+    id INTEGER PRIMARY KEY,
+    cart_id INTEGER NOT NULL REFERENCES cart (id),
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS receipt_item (
+    id INTEGER PRIMARY KEY,
+    receipt_id INTEGER NOT NULL REFERENCES receipt (id),
+    product_id INTEGER NOT NULL REFERENCES product (id),
+    quantity REAL NOT NULL,
+    unit_price REAL NOT NULL,
+    final_price REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS receipt_discount (
+    id INTEGER PRIMARY KEY,
+    receipt_id INTEGER NOT NULL REFERENCES receipt (id),
+    discount_amount REAL NOT NULL
+);
+"""
+
+
+class Database:
+    def __init__(self, path=":memory:"):
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+        self.queries = 0
+        # Shared between request threads and the receipt writer.
+        self.lock = threading.RLock()
+
+    def execute(self, sql, parameters=()):
+        with self.lock:
+            self.queries += 1
+            return self.connection.execute(sql, parameters)
+
+    def executemany(self, sql, rows):
+        with self.lock:
+            self.queries += 1
+            return self.connection.executemany(sql, rows)
+
+    def commit(self):
+        with self.lock:
+            self.connection.commit()
+
+    @contextmanager
+    def transaction(self):
+        with self.lock:
+            try:
+                yield self
+            except BaseException:
+                self.connection.rollback()
+                raise
+            self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+
+database = None
+
+
+def connect(path=":memory:"):
+    global database
+    database = Database(path)
+    return database
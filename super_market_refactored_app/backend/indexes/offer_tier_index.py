@@ -0,0 +1,57 @@
+from bisect import bisect_right
+
+
+class OfferTierIndex:
+    # Per product, the ProductOffer tiers of active offers sorted by
+    # min_quantity. Saves only mark the index stale; the next find() calls
+    # refresh(), which rebuilds it and swaps it in one assignment with the
+    # version it was built from, so lookups never see a half-built index
+    # and a save made during a rebuild marks that rebuild stale too.
+
+    def __init__(self, loader):
+        self.loader = loader
+        self._version = 0
+        self._tiers = None
+
+    def mark_stale(self):
+        self._version += 1
+
+    def refresh(self):
+        version = self._version
+        product_offers, offers = self.loader()
+        active_offer_ids = {offer.id for offer in offers if offer.is_active}
+        tiers = {}
+        for product_offer in product_offers:
+            if product_offer.offer_id in active_offer_ids:
+                tiers.setdefault(product_offer.product_id, []).append(product_offer)
+
+        index = {}
+        for product_id, product_tiers in tiers.items():
+            product_tiers.sort(key=lambda product_offer: product_offer.min_quantity)
+            index[product_id] = ([tier.min_quantity for tier in product_tiers], product_tiers)
+        self._tiers = (version, index)
+        return index
+
+    def find(self, product_id, quantity):
+        tiers = self._tiers
+        if tiers is None or tiers[0] != self._version:
+            index = self.refresh()
+        else:
+            index = tiers[1]
+        entry = index.get(product_id)
+        if entry is None:
+            return None
+        min_quantities, product_tiers = entry
+        position = bisect_right(min_quantities, quantity)
+        if position == 0:
+            return None
+        return product_tiers[position - 1]
+
+
+def load_offer_tiers():
+    from backend.models.offer import Offer
+    from backend.models.product_offer import ProductOffer
+    return ProductOffer.objects.all(), Offer.objects.all()
+
+
+offer_tier_index = OfferTierIndex(load_offer_tiers)
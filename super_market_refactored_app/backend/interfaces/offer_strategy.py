@@ -1,4 +1,7 @@
+from abc import ABC, abstractmethod
+
+
 class OfferStrategy(ABC):
-    @abstract_method
-    def calculate_discount(self):
-        pass
\ No newline at end of file
+    @abstractmethod
+    def calculate_discount(self, unit_price, quantity, min_quantity, argument=None):
+        pass
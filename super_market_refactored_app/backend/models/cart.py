@@ -1 +1,29 @@
-Cart(id, created_at)
\ No newline at end of file
+from datetime import datetime, timezone
+
+from backend import db
+from backend.models.cart_item import CartItem
+from backend.models.model import Model
+from backend.models.product import Product
+
+
+class Cart(Model):
+    table = "cart"
+    fields = ("id", "created_at")
+
+    def __init__(self, id=None, created_at=None):
+        self.id = id
+        self.created_at = created_at or datetime.now(timezone.utc).isoformat()
+        self._items = None
+
+    @property
+    def items(self):
+        if self._items is None:
+            rows = db.database.execute(
+                "SELECT ci.id, ci.product_id, ci.quantity, p.name, p.price, p.unit"
+                " FROM cart_item ci JOIN product p ON p.id = ci.product_id"
+                " WHERE ci.cart_id = ? ORDER BY ci.id",
+                (self.id,))
+            self._items = [CartItem(item_id, self.id, product_id, quantity,
+                                    Product(product_id, name, price, unit))
+                           for item_id, product_id, quantity, name, price, unit in rows]
+        return self._items
@@ -1,12 +1,27 @@
-CartItem(id, cart_id, product_id, quantity)
+from backend.indexes.offer_tier_index import offer_tier_index
+from backend.models.model import Model
+from backend.models.product import Product
 
-def has_available_offer(self):
-    prod_offer = ProductOffer.objects.find(product_id=self.product , min_quantaty <=self.quantity ).
-    if prod_offer.offer.is_active:
-        return True
-    return False
 
-def get_prduct_offer(self):
-    return ProductOffer.objects.find(product_id=self.product , min_quantaty <=self.quantity )
+class CartItem(Model):
+    table = "cart_item"
+    fields = ("id", "cart_id", "product_id", "quantity")
 
+    def __init__(self, id=None, cart_id=None, product_id=None, quantity=None, product=None):
+        self.id = id
+        self.cart_id = cart_id
+        self.product_id = product_id
+        self.quantity = quantity
+        self._product = product
 
+    @property
+    def product(self):
+        if self._product is None:
+            self._product = Product.objects.get(id=self.product_id)
+        return self._product
+
+    def has_available_offer(self):
+        return offer_tier_index.find(self.product_id, self.quantity) is not None
+
+    def get_prduct_offer(self):
+        return offer_tier_index.find(self.product_id, self.quantity)
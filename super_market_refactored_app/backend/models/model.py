@@ -0,0 +1,63 @@
+from backend import db
+
+# Keeps multi-row inserts under SQLITE_MAX_VARIABLE_NUMBER on older builds.
+MAX_PARAMETERS = 900
+
+
+class Manager:
+    def __init__(self, model):
+        self.model = model
+
+    def all(self):
+        return self.filter()
+
+    def filter(self, **conditions):
+        columns = ", ".join(self.model.fields)
+        sql = f"SELECT {columns} FROM {self.model.table}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(f"{field} = ?" for field in conditions)
+        return [self.model(*row) for row in db.database.execute(sql, tuple(conditions.values()))]
+
+    def get(self, **conditions):
+        rows = self.filter(**conditions)
+        if not rows:
+            raise LookupError(f"{self.model.__name__} matching {conditions} does not exist")
+        return rows[0]
+
+    def create(self, **fields):
+        instance = self.model(**fields)
+        instance.save()
+        return instance
+
+    def bulk_insert(self, instances, database=None):
+        # Multi-row INSERTs without a commit, for use inside a transaction.
+        database = database or db.database
+        fields = self.model.fields
+        columns = ", ".join(fields)
+        row = "(" + ", ".join("?" for _ in fields) + ")"
+        per_statement = MAX_PARAMETERS // len(fields)
+        for start in range(0, len(instances), per_statement):
+            chunk = instances[start:start + per_statement]
+            parameters = [getattr(instance, field) for instance in chunk for field in fields]
+            database.execute(
+                f"INSERT INTO {self.model.table} ({columns}) VALUES {', '.join([row] * len(chunk))}",
+                parameters)
+
+
+class Model:
+    table = None
+    fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.objects = Manager(cls)
+
+    def save(self):
+        columns = ", ".join(self.fields)
+        placeholders = ", ".join("?" for _ in self.fields)
+        cursor = db.database.execute(
+            f"INSERT OR REPLACE INTO {self.table} ({columns}) VALUES ({placeholders})",
+            tuple(getattr(self, field) for field in self.fields))
+        if "id" in self.fields and self.id is None:
+            self.id = cursor.lastrowid
+        db.database.commit()
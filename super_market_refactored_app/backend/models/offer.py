@@ -1,7 +1,23 @@
-Offer(id, type, argument, is_active)
+from backend.contexts.offer_context import offer_context
+from backend.indexes.offer_tier_index import offer_tier_index
+from backend.models.model import Model
+from backend.models.offer_type import OfferType
 
 
-def calculate_discount(self,product,quantity,offer_min_quantity_to_apply):
-    offer_calculator_context = OfferCalculatorContext(self.type)
-    offer_calculator_context.calculate_discount(self.type,product,quantity,offer_min_quantity_to_apply,self.argument)
+class Offer(Model):
+    table = "offer"
+    fields = ("id", "type", "argument", "is_active")
 
+    def __init__(self, id=None, type=None, argument=None, is_active=True):
+        self.id = id
+        self.type = OfferType(type)
+        self.argument = argument
+        self.is_active = bool(is_active)
+
+    def calculate_discount(self, product, quantity, offer_min_quantity_to_apply):
+        return offer_context.calculate_discount(
+            self.type, product.price, quantity, offer_min_quantity_to_apply, self.argument)
+
+    def save(self):
+        super().save()
+        offer_tier_index.mark_stale()
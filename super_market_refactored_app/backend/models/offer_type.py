@@ -0,0 +1,11 @@
+import sqlite3
+from enum import Enum
+
+
+class OfferType(Enum):
+    THREE_FOR_TWO = "THREE_FOR_TWO"
+    TEN_PERCENT = "TEN_PERCENT"
+    FIVE_FOR_AMOUNT = "FIVE_FOR_AMOUNT"
+
+
+sqlite3.register_adapter(OfferType, lambda offer_type: offer_type.value)
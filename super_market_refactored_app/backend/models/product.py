@@ -1,3 +1,12 @@
-Product(id, name, price, unit)
+from backend.models.model import Model
 
 
+class Product(Model):
+    table = "product"
+    fields = ("id", "name", "price", "unit")
+
+    def __init__(self, id=None, name=None, price=None, unit=None):
+        self.id = id
+        self.name = name
+        self.price = price
+        self.unit = unit
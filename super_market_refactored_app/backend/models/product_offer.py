@@ -1,2 +1,40 @@
-ProductOffer(product_id, offer_id, min_quantity) 
+from backend import db
+from backend.indexes.offer_tier_index import offer_tier_index
+from backend.models.model import Model
+from backend.models.offer import Offer
 
+
+class ProductOffer(Model):
+    table = "product_offer"
+    fields = ("product_id", "offer_id", "min_quantity")
+
+    def __init__(self, product_id=None, offer_id=None, min_quantity=None, offer=None):
+        self.product_id = product_id
+        self.offer_id = offer_id
+        self.min_quantity = min_quantity
+        self._offer = offer
+
+    @property
+    def offer(self):
+        if self._offer is None:
+            self._offer = Offer.objects.get(id=self.offer_id)
+        return self._offer
+
+    @property
+    def get_minimum_quantity(self):
+        return self.min_quantity
+
+    @classmethod
+    def active_for_cart(cls, cart_id):
+        rows = db.database.execute(
+            "SELECT po.product_id, po.offer_id, po.min_quantity, o.type, o.argument"
+            " FROM product_offer po JOIN offer o ON o.id = po.offer_id"
+            " WHERE o.is_active = 1"
+            " AND po.product_id IN (SELECT product_id FROM cart_item WHERE cart_id = ?)",
+            (cart_id,))
+        return [cls(product_id, offer_id, min_quantity, Offer(offer_id, offer_type, argument, True))
+                for product_id, offer_id, min_quantity, offer_type, argument in rows]
+
+    def save(self):
+        super().save()
+        offer_tier_index.mark_stale()
@@ -1 +1,76 @@
-Receipt(id, cart_id, created_at)
\ No newline at end of file
+from datetime import datetime, timezone
+
+from backend import db
+from backend.models.model import Model
+from backend.models.receipt_discount import ReceiptDiscount
+from backend.models.receipt_item import ReceiptItem
+
+
+class Receipt(Model):
+    table = "receipt"
+    fields = ("id", "cart_id", "created_at")
+
+    def __init__(self, id=None, cart_id=None, created_at=None):
+        self.id = id
+        self.cart_id = cart_id
+        self.created_at = created_at or datetime.now(timezone.utc).isoformat()
+        self.items = []
+        self.discounts = []
+        self.products = {}
+
+    def add_item(self, product, quantity, unit_price, final_price):
+        self.products[product.id] = product
+        self.items.append(ReceiptItem(
+            receipt_id=self.id, product_id=product.id, quantity=quantity,
+            unit_price=unit_price, final_price=final_price))
+
+    def add_discount(self, discount_amount):
+        self.discounts.append(ReceiptDiscount(receipt_id=self.id, discount_amount=discount_amount))
+
+    def assign_id(self, id):
+        self.id = id
+        for row in self.items + self.discounts:
+            row.receipt_id = id
+
+    def save(self):
+        with db.database.transaction():
+            if self.id is None:
+                cursor = db.database.execute(
+                    "INSERT INTO receipt (cart_id, created_at) VALUES (?, ?)", (self.cart_id, self.created_at))
+                self.assign_id(cursor.lastrowid)
+            else:
+                Receipt.objects.bulk_insert([self])
+            ReceiptItem.objects.bulk_insert(self.items)
+            ReceiptDiscount.objects.bulk_insert(self.discounts)
+
+    def total_price(self):
+        return sum(item.final_price for item in self.items)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "cart_id": self.cart_id,
+            "created_at": self.created_at,
+            "items": [
+                {
+                    "product_id": item.product_id,
+                    "name": self.products[item.product_id].name,
+                    "unit": self.products[item.product_id].unit,
+                    "quantity": item.quantity,
+                    "unit_price": item.unit_price,
+                    "final_price": item.final_price,
+                }
+                for item in self.items
+            ],
+            "discounts": [{"discount_amount": discount.discount_amount} for discount in self.discounts],
+            "total": self.total_price(),
+        }
+
+
+def persist_receipts(receipts, database=None):
+    # Receipts must already have ids; item and discount rows of the whole
+    # batch go out as a handful of multi-row INSERTs.
+    Receipt.objects.bulk_insert(receipts, database)
+    ReceiptItem.objects.bulk_insert([item for receipt in receipts for item in receipt.items], database)
+    ReceiptDiscount.objects.bulk_insert(
+        [discount for receipt in receipts for discount in receipt.discounts], database)
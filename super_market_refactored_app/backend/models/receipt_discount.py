@@ -1,2 +1,11 @@
+from backend.models.model import Model
 
-ReceiptDiscount(receipt_id, discount_amount)
\ No newline at end of file
+
+class ReceiptDiscount(Model):
+    table = "receipt_discount"
+    fields = ("id", "receipt_id", "discount_amount")
+
+    def __init__(self, id=None, receipt_id=None, discount_amount=None):
+        self.id = id
+        self.receipt_id = receipt_id
+        self.discount_amount = discount_amount
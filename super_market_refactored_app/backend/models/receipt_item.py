@@ -1,2 +1,15 @@
+from backend.models.model import Model
 
-ReceiptItem(receipt_id, product_id, quantity, unit_price, final_price)
\ No newline at end of file
+
+class ReceiptItem(Model):
+    table = "receipt_item"
+    fields = ("id", "receipt_id", "product_id", "quantity", "unit_price", "final_price")
+
+    def __init__(self, id=None, receipt_id=None, product_id=None, quantity=None, unit_price=None,
+                 final_price=None):
+        self.id = id
+        self.receipt_id = receipt_id
+        self.product_id = product_id
+        self.quantity = quantity
+        self.unit_price = unit_price
+        self.final_price = final_price
@@ -0,0 +1,117 @@
+import atexit
+import itertools
+import queue
+import threading
+import time
+
+from backend import db
+from backend.models.receipt import Receipt, persist_receipts
+
+_STOP = object()
+
+
+class _Flush:
+    def __init__(self):
+        self.done = threading.Event()
+        self.error = None
+
+
+class ReceiptWriter:
+    # Write-behind store for receipts. submit() only hands out an id and
+    # queues the receipt; a background thread writes queued receipts once
+    # batch_size rows are waiting or flush_interval seconds have passed
+    # since the oldest one arrived. Receipts still queued at interpreter
+    # exit are written by close(), which is registered with atexit. A
+    # failed batch is kept and retried; flush() and close() raise if it
+    # still cannot be written.
+
+    def __init__(self, database=None, batch_size=500, flush_interval=1.0):
+        self.database = database or db.database
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.flushes = 0
+        self.failures = 0
+        self.last_error = None
+        # Ids are assigned here so receipt, item and discount rows can all
+        # be written later; this assumes one writer per database.
+        last_id = self.database.execute("SELECT MAX(id) FROM receipt").fetchone()[0]
+        self._ids = itertools.count((last_id or 0) + 1)
+        self._queue = queue.Queue()
+        self._closed = False
+        # Keeps submit and flush from queueing anything behind _STOP.
+        self._state_lock = threading.Lock()
+        self._unwritten = []
+        self._thread = threading.Thread(target=self._run, name="receipt-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, receipt):
+        with self._state_lock:
+            if self._closed:
+                raise RuntimeError("receipt writer is closed")
+            receipt.assign_id(next(self._ids))
+            self._queue.put(receipt)
+
+    def flush(self):
+        request = _Flush()
+        with self._state_lock:
+            if self._closed:
+                raise RuntimeError("receipt writer is closed")
+            self._queue.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise RuntimeError("queued receipts could not be written") from request.error
+
+    def close(self):
+        with self._state_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+        atexit.unregister(self.close)
+        if self._unwritten:
+            raise RuntimeError(f"{len(self._unwritten)} receipts could not be written") from self.last_error
+
+    def _run(self):
+        batch = []
+        rows = 0
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                entry = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                entry = None
+            if isinstance(entry, Receipt):
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(entry)
+                rows += 1 + len(entry.items) + len(entry.discounts)
+                if rows < self.batch_size:
+                    continue
+            if batch and self._write(batch):
+                batch = []
+                rows = 0
+                deadline = None
+            elif batch:
+                # Keep the batch and try again after another interval.
+                deadline = time.monotonic() + self.flush_interval
+            if entry is _STOP:
+                self._unwritten = batch
+                return
+            if isinstance(entry, _Flush):
+                if batch:
+                    entry.error = self.last_error
+                entry.done.set()
+
+    def _write(self, batch):
+        try:
+            with self.database.transaction():
+                persist_receipts(batch, self.database)
+        except Exception as error:
+            self.failures += 1
+            self.last_error = error
+            return False
+        self.flushes += 1
+        return True
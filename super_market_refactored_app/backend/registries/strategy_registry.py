@@ -0,0 +1,44 @@
+import importlib
+import threading
+
+from backend.models.offer_type import OfferType
+
+
+class StrategyRegistry:
+    # Maps offer types to strategies. A strategy may be registered as a
+    # class or as a "module:Class" path; either way it is instantiated on
+    # first use and the instance is shared from then on.
+
+    def __init__(self):
+        self._factories = {}
+        self._instances = {}
+        self._lock = threading.Lock()
+
+    def register(self, offer_type, strategy):
+        with self._lock:
+            self._factories[offer_type] = strategy
+            self._instances.pop(offer_type, None)
+
+    def get(self, offer_type):
+        strategy = self._instances.get(offer_type)
+        if strategy is None:
+            with self._lock:
+                strategy = self._instances.get(offer_type)
+                if strategy is None:
+                    factory = self._factories.get(offer_type)
+                    if factory is None:
+                        raise LookupError(f"no strategy registered for {offer_type}")
+                    if isinstance(factory, str):
+                        module, name = factory.split(":")
+                        factory = getattr(importlib.import_module(module), name)
+                    strategy = self._instances[offer_type] = factory()
+        return strategy
+
+    def __contains__(self, offer_type):
+        return offer_type in self._factories
+
+
+strategy_registry = StrategyRegistry()
+strategy_registry.register(OfferType.THREE_FOR_TWO, "backend.strategies.three_for_two_strategy:ThreeForTwoStrategy")
+strategy_registry.register(OfferType.TEN_PERCENT, "backend.strategies.percentage_strategy:PercentageDiscountStrategy")
+strategy_registry.register(OfferType.FIVE_FOR_AMOUNT, "backend.strategies.bulk_discount_strategy:BulkDiscountStrategy")
@@ -0,0 +1,154 @@
+import json
+import struct
+
+# Both encoders write straight from the Receipt model into a bytearray.
+# Everything that only depends on the product is rendered once and reused
+# for every receipt line of that product.
+
+_ITEM_PRICES = struct.Struct("<ddd")
+_DOUBLE = struct.Struct("<d")
+_HEADER = struct.Struct("<qqH")
+_COUNT = struct.Struct("<I")
+_PRODUCT = struct.Struct("<qH")
+
+
+def _json_value(value):
+    if value is None:
+        return b"null"
+    if isinstance(value, str):
+        return json.dumps(value).encode()
+    return repr(value).encode()
+
+
+class ReceiptJsonEncoder:
+    content_type = "application/json"
+
+    def __init__(self, max_products=10000):
+        self.max_products = max_products
+        self._fragments = {}
+
+    def encode(self, receipt):
+        out = bytearray(b'{"id":')
+        out += _json_value(receipt.id)
+        out += b',"cart_id":'
+        out += _json_value(receipt.cart_id)
+        out += b',"created_at":'
+        out += _json_value(receipt.created_at)
+        out += b',"items":['
+        products = receipt.products
+        separator = b"{"
+        for item in receipt.items:
+            out += separator
+            out += self._product_fragment(products[item.product_id])
+            out += repr(item.quantity).encode()
+            out += b',"unit_price":'
+            out += repr(item.unit_price).encode()
+            out += b',"final_price":'
+            out += repr(item.final_price).encode()
+            out += b"}"
+            separator = b",{"
+        out += b'],"discounts":['
+        separator = b'{"discount_amount":'
+        for discount in receipt.discounts:
+            out += separator
+            out += repr(discount.discount_amount).encode()
+            out += b"}"
+            separator = b',{"discount_amount":'
+        # total_price() rather than a running sum, so the total matches
+        # to_dict() where sum() is compensated (Python 3.12+).
+        out += b'],"total":'
+        out += repr(receipt.total_price()).encode()
+        out += b"}"
+        return bytes(out)
+
+    def _product_fragment(self, product):
+        key = (product.id, product.name, product.unit)
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            if len(self._fragments) >= self.max_products:
+                self._fragments.clear()
+            fragment = self._fragments[key] = b"".join((
+                b'"product_id":', _json_value(product.id),
+                b',"name":', _json_value(product.name),
+                b',"unit":', _json_value(product.unit),
+                b',"quantity":'))
+        return fragment
+
+
+class ReceiptBinaryEncoder:
+    # Little-endian layout:
+    #   receipt id, cart id (int64, -1 for none), created_at (uint16 length + utf-8)
+    #   item count (uint32), then per item:
+    #     product id (int64), name (uint16 length + utf-8), unit (uint16 length + utf-8),
+    #     quantity, unit price, final price (float64)
+    #   discount count (uint32), then one float64 per discount
+    #   total (float64)
+    content_type = "application/octet-stream"
+
+    def __init__(self, max_products=10000):
+        self.max_products = max_products
+        self._fragments = {}
+
+    def encode(self, receipt):
+        created_at = receipt.created_at.encode()
+        out = bytearray(_HEADER.pack(_id(receipt.id), _id(receipt.cart_id), len(created_at)))
+        out += created_at
+        out += _COUNT.pack(len(receipt.items))
+        products = receipt.products
+        pack_prices = _ITEM_PRICES.pack
+        for item in receipt.items:
+            out += self._product_fragment(products[item.product_id])
+            out += pack_prices(item.quantity, item.unit_price, item.final_price)
+        out += _COUNT.pack(len(receipt.discounts))
+        for discount in receipt.discounts:
+            out += _DOUBLE.pack(discount.discount_amount)
+        out += _DOUBLE.pack(receipt.total_price())
+        return bytes(out)
+
+    def decode(self, data):
+        view = memoryview(data)
+        receipt_id, cart_id, length = _HEADER.unpack_from(view)
+        offset = _HEADER.size
+        created_at = bytes(view[offset:offset + length]).decode()
+        offset += length
+        (count,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+        items = []
+        for _ in range(count):
+            product_id, length = _PRODUCT.unpack_from(view, offset)
+            offset += _PRODUCT.size
+            name = bytes(view[offset:offset + length]).decode()
+            offset += length
+            (length,) = struct.unpack_from("<H", view, offset)
+            offset += 2
+            unit = bytes(view[offset:offset + length]).decode()
+            offset += length
+            quantity, unit_price, final_price = _ITEM_PRICES.unpack_from(view, offset)
+            offset += _ITEM_PRICES.size
+            items.append({"product_id": product_id, "name": name, "unit": unit, "quantity": quantity,
+                          "unit_price": unit_price, "final_price": final_price})
+        (count,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+        discounts = [{"discount_amount": amount}
+                     for (amount,) in _DOUBLE.iter_unpack(view[offset:offset + count * _DOUBLE.size])]
+        offset += count * _DOUBLE.size
+        (total,) = _DOUBLE.unpack_from(view, offset)
+        return {"id": None if receipt_id == -1 else receipt_id,
+                "cart_id": None if cart_id == -1 else cart_id,
+                "created_at": created_at, "items": items, "discounts": discounts, "total": total}
+
+    def _product_fragment(self, product):
+        key = (product.id, product.name, product.unit)
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            if len(self._fragments) >= self.max_products:
+                self._fragments.clear()
+            name = product.name.encode()
+            unit = str(product.unit).encode()
+            fragment = self._fragments[key] = b"".join((
+                _PRODUCT.pack(product.id, len(name)), name, struct.pack("<H", len(unit)), unit))
+        return fragment
+
+
+def _id(value):
+    return -1 if value is None else value
@@ -1,19 +1,27 @@
+from backend.contexts.offer_context import offer_context
+from backend.indexes.offer_tier_index import OfferTierIndex
+from backend.models.cart import Cart
+from backend.models.product_offer import ProductOffer
+
+
 class CartService:
-    
-    def get_cart(self):
-        #this function should return cart
-        
-    def get_discounts(self):
+    def __init__(self):
+        self.offer_context = offer_context
+
+    def get_cart(self, cart_id):
+        return Cart.objects.get(id=cart_id)
+
+    def get_discounts(self, cart):
+        # Two queries per cart whatever its size: the items with their
+        # products, and the active product offers for those products.
+        product_offers = ProductOffer.active_for_cart(cart.id)
+        tiers = OfferTierIndex(lambda: (product_offers, [po.offer for po in product_offers]))
         item_discounts = {}
-        for item in items:
-            if item.has_offer():
-                product_offer = item.get_product_offer()
+        for item in cart.items:
+            product_offer = tiers.find(item.product_id, item.quantity)
+            if product_offer is not None:
                 offer = product_offer.offer
-                offer_min_quantity = product_offer.get_minimum_quantity
-                disc = offer.calculate_discount(item.product,quantity,offer_min_quantity)
+                disc = self.offer_context.calculate_discount(
+                    offer.type, item.product.price, item.quantity, product_offer.min_quantity, offer.argument)
                 item_discounts[item.id] = disc
         return item_discounts
-
-            
-
-        
\ No newline at end of file
@@ -1,7 +1,22 @@
+from backend.models.receipt import Receipt
+
+
 class ReceiptService:
+    def __init__(self, writer=None):
+        # With a ReceiptWriter the rows are written in the background and
+        # checkout does not wait for the database.
+        self.writer = writer
+
     def generate(self, cart, item_discounts):
-        receipt = Receipt()
+        receipt = Receipt(cart_id=cart.id)
         for item in cart.items:
-            discount = item_discounts.get(item.id)
-            receipt.add_item(item.product, item.quantity, item.product.price,item.product.price - discount)
-            receipt.add_discount(discount)
\ No newline at end of file
+            discount = item_discounts.get(item.id, 0)
+            receipt.add_item(item.product, item.quantity, item.product.price,
+                             item.quantity * item.product.price - discount)
+            if discount:
+                receipt.add_discount(discount)
+        if self.writer is None:
+            receipt.save()
+        else:
+            self.writer.submit(receipt)
+        return receipt
@@ -1,4 +1,13 @@
-class BulkDiscountStrategy:
+from backend.interfaces.offer_strategy import OfferStrategy
+
+
+class BulkDiscountStrategy(OfferStrategy):
     def calculate_discount(self, unit_price, quantity, min_quantity, bulk_price):
-       #this function should calculate the discount based on 
-       #bulk_price (argument) and min_quantity_to_apply_offer
\ No newline at end of file
+        if quantity < min_quantity:
+            return 0
+
+        full_price = quantity * unit_price
+        bundles, remainder = divmod(quantity, min_quantity)
+        discounted_price = bundles * bulk_price + remainder * unit_price
+
+        return full_price - discounted_price
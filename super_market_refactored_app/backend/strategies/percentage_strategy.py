@@ -1,7 +1,10 @@
-class PercentageDiscountStrategy:
+from backend.interfaces.offer_strategy import OfferStrategy
+
+
+class PercentageDiscountStrategy(OfferStrategy):
     def calculate_discount(self, unit_price, quantity, min_quantity, percentage):
         if quantity < min_quantity:
             return 0
             
         full_price = quantity * unit_price
-        return full_price * (percentage / 100)
\ No newline at end of file
+        return full_price * (percentage / 100)
@@ -1,4 +1,7 @@
-class ThreeForTwoStrategy:
+from backend.interfaces.offer_strategy import OfferStrategy
+
+
+class ThreeForTwoStrategy(OfferStrategy):
     def calculate_discount(self, unit_price, quantity, min_quantity, _=None):
         if quantity < min_quantity:
             return 0
@@ -7,4 +10,4 @@ class ThreeForTwoStrategy:
         paid_items = (quantity // 3) * 2 + (quantity % 3)
         discounted_price = paid_items * unit_price
         
-        return full_price - discounted_price
\ No newline at end of file
+        return full_price - discounted_price
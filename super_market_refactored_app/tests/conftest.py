@@ -0,0 +1,46 @@
+import pytest
+from backend import db
+from backend.indexes.offer_tier_index import offer_tier_index
+from backend.models.cart import Cart
+from backend.models.cart_item import CartItem
+from backend.models.offer import Offer
+from backend.models.offer_type import OfferType
+from backend.models.product import Product
+from backend.models.product_offer import ProductOffer
+
+
+@pytest.fixture
+def database():
+    database = db.connect()
+    # The shared index may still hold tiers from another test's database.
+    offer_tier_index.mark_stale()
+    yield database
+    database.close()
+
+
+class Shop:
+    # Products with a few offers in the test database, and carts filled
+    # from them. Every item has quantity 3 except the second, which has 6.
+
+    def __init__(self, products=60):
+        self.products = [Product.objects.create(name=f"product {i}", price=1.0 + i, unit="EACH")
+                         for i in range(products)]
+        three_for_two = Offer.objects.create(type=OfferType.THREE_FOR_TWO, argument=None)
+        ten_percent = Offer.objects.create(type=OfferType.TEN_PERCENT, argument=10.0)
+        five_for_amount = Offer.objects.create(type=OfferType.FIVE_FOR_AMOUNT, argument=5.0)
+        inactive = Offer.objects.create(type=OfferType.TEN_PERCENT, argument=50.0, is_active=False)
+        ProductOffer.objects.create(product_id=self.products[0].id, offer_id=three_for_two.id, min_quantity=3)
+        ProductOffer.objects.create(product_id=self.products[1].id, offer_id=ten_percent.id, min_quantity=1)
+        ProductOffer.objects.create(product_id=self.products[1].id, offer_id=five_for_amount.id, min_quantity=5)
+        ProductOffer.objects.create(product_id=self.products[2].id, offer_id=inactive.id, min_quantity=1)
+
+    def cart(self, size):
+        cart = Cart.objects.create()
+        for i, product in enumerate(self.products[:size]):
+            CartItem.objects.create(cart_id=cart.id, product_id=product.id, quantity=6 if i == 1 else 3)
+        return cart
+
+
+@pytest.fixture
+def shop(database):
+    return Shop()
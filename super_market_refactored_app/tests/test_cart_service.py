@@ -0,0 +1,25 @@
+import pytest
+from backend.services.cart_service import CartService
+
+
+class TestCartService:
+
+    @pytest.mark.parametrize("size", [1, 5, 50])
+    def test_queries_per_cart_do_not_grow_with_its_size(self, database, shop, size):
+        cart_id = shop.cart(size).id
+        service = CartService()
+        before = database.queries
+
+        cart = service.get_cart(cart_id)
+        service.get_discounts(cart)
+
+        assert database.queries - before == 3
+
+    def test_discounts_use_the_highest_active_tier(self, shop):
+        service = CartService()
+        cart = service.get_cart(shop.cart(5).id)
+
+        discounts = service.get_discounts(cart)
+
+        items = cart.items
+        assert discounts == {items[0].id: pytest.approx(1.0), items[1].id: pytest.approx(5.0)}
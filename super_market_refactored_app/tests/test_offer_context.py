@@ -0,0 +1,93 @@
+import pytest
+from backend.contexts.offer_context import OfferContext
+from backend.models.offer_type import OfferType
+from backend.registries.strategy_registry import StrategyRegistry, strategy_registry
+from backend.strategies.percentage_strategy import PercentageDiscountStrategy
+
+
+class CountingStrategy:
+    instances = 0
+
+    def __init__(self, discount=1.0):
+        CountingStrategy.instances += 1
+        self.discount = discount
+        self.calls = 0
+
+    def calculate_discount(self, unit_price, quantity, min_quantity, argument=None):
+        self.calls += 1
+        return self.discount
+
+
+class TestStrategyRegistry:
+
+    def test_default_registry_covers_every_offer_type(self):
+        for offer_type in OfferType:
+            assert offer_type in strategy_registry
+        assert isinstance(strategy_registry.get(OfferType.TEN_PERCENT), PercentageDiscountStrategy)
+
+    def test_strategies_are_loaded_once_on_first_use(self):
+        registry = StrategyRegistry()
+        registry.register("BOGOF", CountingStrategy)
+        before = CountingStrategy.instances
+
+        first = registry.get("BOGOF")
+
+        assert registry.get("BOGOF") is first
+        assert CountingStrategy.instances == before + 1
+
+    def test_strategies_can_be_registered_by_path(self):
+        registry = StrategyRegistry()
+        registry.register(OfferType.TEN_PERCENT, "backend.strategies.percentage_strategy:PercentageDiscountStrategy")
+        assert isinstance(registry.get(OfferType.TEN_PERCENT), PercentageDiscountStrategy)
+
+    def test_unknown_offer_type(self):
+        with pytest.raises(LookupError):
+            StrategyRegistry().get(OfferType.THREE_FOR_TWO)
+
+    def test_registering_again_replaces_the_instance(self):
+        registry = StrategyRegistry()
+        registry.register("BOGOF", CountingStrategy)
+        old = registry.get("BOGOF")
+
+        registry.register("BOGOF", lambda: CountingStrategy(2.0))
+
+        assert registry.get("BOGOF") is not old
+        assert registry.get("BOGOF").discount == 2.0
+
+
+class TestOfferContext:
+
+    @pytest.fixture
+    def registry(self):
+        registry = StrategyRegistry()
+        registry.register("BOGOF", CountingStrategy)
+        return registry
+
+    def test_repeated_calculations_hit_the_memo(self, registry):
+        context = OfferContext(registry)
+
+        for _ in range(3):
+            assert context.calculate_discount("BOGOF", 2.0, 4, 2) == 1.0
+        context.calculate_discount("BOGOF", 2.0, 5, 2)
+
+        assert registry.get("BOGOF").calls == 2
+        info = context.memo_info()
+        assert (info.hits, info.misses) == (2, 2)
+
+        context.clear_memo()
+        context.calculate_discount("BOGOF", 2.0, 4, 2)
+        assert registry.get("BOGOF").calls == 3
+
+    def test_replacing_a_strategy_bypasses_memoized_results(self, registry):
+        context = OfferContext(registry)
+        assert context.calculate_discount("BOGOF", 2.0, 4, 2) == 1.0
+
+        registry.register("BOGOF", lambda: CountingStrategy(2.0))
+
+        assert context.calculate_discount("BOGOF", 2.0, 4, 2) == 2.0
+
+    def test_memo_is_bounded(self, registry):
+        context = OfferContext(registry, memo_size=2)
+        for quantity in range(5):
+            context.calculate_discount("BOGOF", 2.0, quantity, 2)
+        assert context.memo_info().currsize == 2
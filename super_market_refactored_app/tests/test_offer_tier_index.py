@@ -0,0 +1,66 @@
+import pytest
+from backend.indexes.offer_tier_index import OfferTierIndex, offer_tier_index
+from backend.models.cart import Cart
+from backend.models.cart_item import CartItem
+from backend.models.offer import Offer
+from backend.models.offer_type import OfferType
+from backend.models.product import Product
+from backend.models.product_offer import ProductOffer
+
+
+class CountingLoader:
+    def __init__(self, product_offers, offers):
+        self.product_offers = product_offers
+        self.offers = offers
+        self.loads = 0
+
+    def __call__(self):
+        self.loads += 1
+        return self.product_offers, self.offers
+
+
+class TestOfferTierIndex:
+
+    @pytest.fixture
+    def loader(self):
+        ten = Offer(1, OfferType.TEN_PERCENT, 10.0)
+        bulk = Offer(2, OfferType.FIVE_FOR_AMOUNT, 5.0)
+        inactive = Offer(3, OfferType.TEN_PERCENT, 50.0, is_active=False)
+        return CountingLoader([ProductOffer(1, bulk.id, 5), ProductOffer(1, ten.id, 1),
+                               ProductOffer(2, inactive.id, 1)],
+                              [ten, bulk, inactive])
+
+    @pytest.mark.parametrize("quantity, offer_id", [(0.5, None), (1, 1), (4.9, 1), (5, 2), (50, 2)])
+    def test_finds_the_highest_tier_reached(self, loader, quantity, offer_id):
+        tier = OfferTierIndex(loader).find(1, quantity)
+        assert (tier and tier.offer_id) == offer_id
+
+    def test_inactive_offers_are_left_out(self, loader):
+        index = OfferTierIndex(loader)
+        assert index.find(2, 10) is None
+        assert index.find(3, 10) is None
+
+    def test_rebuilds_lazily_once_stale(self, loader):
+        index = OfferTierIndex(loader)
+        index.find(1, 1)
+        for _ in range(100):
+            index.mark_stale()
+        assert loader.loads == 1
+
+        loader.offers[2].is_active = True
+        assert index.find(2, 1).offer_id == 3
+        assert loader.loads == 2
+
+    def test_saves_mark_the_shared_index_stale(self, database):
+        product = Product.objects.create(name="toothbrush", price=0.99, unit="EACH")
+        cart = Cart.objects.create()
+        item = CartItem.objects.create(cart_id=cart.id, product_id=product.id, quantity=3)
+        assert not item.has_available_offer()
+
+        offer = Offer.objects.create(type=OfferType.THREE_FOR_TWO, argument=None)
+        ProductOffer.objects.create(product_id=product.id, offer_id=offer.id, min_quantity=3)
+
+        assert item.get_prduct_offer().offer_id == offer.id
+        offer.is_active = False
+        offer.save()
+        assert offer_tier_index.find(product.id, 3) is None
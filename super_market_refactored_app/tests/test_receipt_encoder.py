@@ -0,0 +1,49 @@
+import json
+
+import pytest
+from backend.models.product import Product
+from backend.models.receipt import Receipt
+from backend.serializers.receipt_encoder import ReceiptBinaryEncoder, ReceiptJsonEncoder
+from backend.services.cart_service import CartService
+from backend.services.receipt_service import ReceiptService
+
+
+class TestReceiptEncoders:
+
+    @pytest.fixture
+    def receipt(self, shop):
+        service = CartService()
+        cart = service.get_cart(shop.cart(50).id)
+        receipt = ReceiptService().generate(cart, service.get_discounts(cart))
+        receipt.products[cart.items[3].product_id].name = 'quote " and ünïcode\n'
+        return receipt
+
+    def test_json_matches_to_dict(self, receipt):
+        assert json.loads(ReceiptJsonEncoder().encode(receipt)) == receipt.to_dict()
+
+    def test_binary_round_trip(self, receipt):
+        encoder = ReceiptBinaryEncoder()
+        assert encoder.decode(encoder.encode(receipt)) == receipt.to_dict()
+
+    @pytest.mark.parametrize("encoder", [ReceiptJsonEncoder(), ReceiptBinaryEncoder()])
+    def test_unsaved_empty_receipt(self, encoder):
+        receipt = Receipt(created_at="2024-01-01T00:00:00+00:00")
+        encoded = encoder.encode(receipt)
+        decoded = json.loads(encoded) if isinstance(encoder, ReceiptJsonEncoder) else encoder.decode(encoded)
+        assert decoded == receipt.to_dict()
+
+    @pytest.mark.parametrize("encoder_type", [ReceiptJsonEncoder, ReceiptBinaryEncoder])
+    def test_product_fragments_follow_renames(self, encoder_type):
+        encoder = encoder_type(max_products=1)
+        product = Product(7, "rice", 2.49, "EACH")
+        receipt = Receipt(id=1, cart_id=1, created_at="2024-01-01T00:00:00+00:00")
+        receipt.add_item(product, 1, 2.49, 2.49)
+        first = encoder.encode(receipt)
+
+        product.name = "brown rice"
+        second = encoder.encode(receipt)
+
+        assert first != second
+        assert b"brown rice" in second
+        assert encoder.encode(receipt) == second
+        assert len(encoder._fragments) == 1
@@ -0,0 +1,107 @@
+import time
+
+import pytest
+from backend.persistence import receipt_writer
+from backend.persistence.receipt_writer import ReceiptWriter
+from backend.services.cart_service import CartService
+from backend.services.receipt_service import ReceiptService
+
+
+def count(database, table):
+    return database.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestReceiptWriter:
+
+    @pytest.fixture
+    def checkout(self, shop):
+        service = CartService()
+        cart = service.get_cart(shop.cart(5).id)
+        discounts = service.get_discounts(cart)
+        return lambda receipts: receipts.generate(cart, discounts)
+
+    @pytest.fixture
+    def writer(self, database):
+        writer = ReceiptWriter(batch_size=10_000, flush_interval=60)
+        yield writer
+        writer.close()
+
+    @pytest.fixture
+    def failing_writes(self, monkeypatch):
+        def fail(receipts, database):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(receipt_writer, "persist_receipts", fail)
+
+    def test_submit_does_not_touch_the_database(self, database, writer, checkout):
+        receipts = ReceiptService(writer)
+        before = database.queries
+
+        submitted = [checkout(receipts) for _ in range(20)]
+
+        assert database.queries == before
+        assert count(database, "receipt") == 0
+        assert [receipt.id for receipt in submitted] == list(range(1, 21))
+
+    def test_flush_writes_the_batch_at_once(self, database, writer, checkout):
+        receipts = ReceiptService(writer)
+        for _ in range(20):
+            checkout(receipts)
+
+        writer.flush()
+
+        assert writer.flushes == 1
+        assert count(database, "receipt") == 20
+        assert count(database, "receipt_item") == 100
+        assert count(database, "receipt_discount") == 40
+
+    def test_full_batches_are_written_without_a_flush(self, database, checkout):
+        # Each receipt is 8 rows: itself, 5 items and 2 discounts.
+        writer = ReceiptWriter(batch_size=16, flush_interval=60)
+        receipts = ReceiptService(writer)
+        for _ in range(3):
+            checkout(receipts)
+
+        deadline = time.monotonic() + 5
+        while writer.flushes < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        written = count(database, "receipt")
+        writer.close()
+
+        assert written == 2
+        assert count(database, "receipt") == 3
+
+    def test_close_writes_what_is_queued(self, database, writer, checkout):
+        receipts = ReceiptService(writer)
+        for _ in range(5):
+            checkout(receipts)
+
+        writer.close()
+
+        assert count(database, "receipt") == 5
+        with pytest.raises(RuntimeError, match="closed"):
+            writer.flush()
+        with pytest.raises(RuntimeError, match="closed"):
+            checkout(receipts)
+
+    def test_flush_reports_a_failed_write(self, database, writer, checkout, failing_writes, monkeypatch):
+        checkout(ReceiptService(writer))
+
+        with pytest.raises(RuntimeError, match="could not be written") as error:
+            writer.flush()
+
+        assert isinstance(error.value.__cause__, OSError)
+        assert writer.failures == 1
+        monkeypatch.undo()
+        writer.flush()
+        assert count(database, "receipt") == 1
+
+    def test_close_reports_receipts_it_could_not_write(self, database, checkout, failing_writes):
+        writer = ReceiptWriter(batch_size=10_000, flush_interval=60)
+        checkout(ReceiptService(writer))
+        checkout(ReceiptService(writer))
+
+        with pytest.raises(RuntimeError, match="2 receipts could not be written"):
+            writer.close()
+
+        assert count(database, "receipt") == 0